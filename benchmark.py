@@ -0,0 +1,149 @@
+import os
+import sys
+import random
+import argparse
+import contextlib
+from time import perf_counter
+
+# render without a window or a sound card
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# import pygame silently
+with contextlib.redirect_stdout(None):
+    import pygame
+
+from game import Game
+from src.particles import Particles
+from src.variables import GAME_WIDTH, GAME_HEIGHT
+
+PHASES = ("background", "sidebar", "healthbar", "queue", "draw", "display")
+
+
+class Scene:
+    def __init__(self, invaders: int, lasers: int, bombs: int, explosions: int):
+        """initialize a synthetic scene, sprites data moving down or up"""
+        self.invaders = [self.sprite(f"invader{i % 4}", 0.1) for i in range(invaders)]
+        self.lasers = [self.sprite("laser", -0.5) for i in range(lasers)]
+        self.bombs = [self.sprite("bomb", 0.3) for i in range(bombs)]
+        self.explosions = [self.sprite("explode", 0) for i in range(explosions)]
+        self.particles = Particles()
+        self.player = {"image_name": "spaceship0", "x": 330, "y": GAME_HEIGHT - 100}
+        self.boss = {
+            "image_name": "boss",
+            "x": 200,
+            "y": 100,
+            "life": 10,
+            "alive": True,
+        }
+        self.score = 0
+
+    def sprite(self, image_name: str, speed: float) -> dict:
+        """return the data of a sprite at a random position"""
+        return {
+            "image_name": image_name,
+            "x": random.randrange(GAME_WIDTH - 64),
+            "y": random.randrange(GAME_HEIGHT),
+            "speed": speed,
+        }
+
+    def update(self, dt: int, frame: int) -> None:
+        """move the sprites, explode and score now and then"""
+        for sprite in self.invaders + self.lasers + self.bombs:
+            sprite["y"] = (sprite["y"] + sprite["speed"] * dt) % GAME_HEIGHT
+        if self.explosions and frame % 10 == 0:
+            explosion = self.explosions[frame // 10 % len(self.explosions)]
+            self.particles.burst(explosion["x"] + 32, explosion["y"] + 32)
+        self.particles.update(dt)
+        if frame % 30 == 0:
+            self.score += 1
+            self.boss["life"] = 10 - self.score % 10
+
+
+def run(game: Game, scene: Scene, frames: int, warmup: int) -> dict:
+    """draw the scene, return the total time of each phase, in seconds"""
+    times = dict.fromkeys(PHASES, 0)
+    queue = game.queue
+    dt = 16
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            times = dict.fromkeys(PHASES, 0)
+            start = perf_counter()
+        scene.update(dt, frame)
+        pygame.event.pump()
+
+        t0 = perf_counter()
+        game.background.update(dt, playing=True)
+        t1 = perf_counter()
+        game.sidebar.update(life=3, score1=scene.score, highscore=scene.score)
+        t2 = perf_counter()
+        game.bosshealthbar.update(scene.boss)
+        t3 = perf_counter()
+        queue.add_sprites_data("background", scene.explosions)
+        queue.add_particles(scene.particles)
+        queue.add_sprites_data("enemies", scene.invaders)
+        queue.add_sprites_data("enemies", (scene.boss,))
+        queue.add_sprites_data("projectiles", scene.bombs)
+        queue.add_sprites_data("projectiles", scene.lasers)
+        queue.add_sprites_data("players", (scene.player,))
+        t4 = perf_counter()
+        game.draw_game(
+            game.sidebar,
+            game.bosshealthbar if game.bosshealthbar.visible else None,
+            playing=True,
+        )
+        t5 = perf_counter()
+        game.update_display()
+        t6 = perf_counter()
+
+        # the clock gives its frame time to the dynamic resolution
+        dt = min(game.clock.tick(), 50)
+        for phase, duration in zip(
+            PHASES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t5 - t4, t6 - t5)
+        ):
+            times[phase] += duration
+    times["total"] = perf_counter() - start
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="benchmark the rendering of the game without a display"
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--warmup", type=int, default=60)
+    parser.add_argument("--invaders", type=int, default=15)
+    parser.add_argument("--lasers", type=int, default=10)
+    parser.add_argument("--bombs", type=int, default=5)
+    parser.add_argument("--explosions", type=int, default=5)
+    parser.add_argument("--renderer", choices=("surface", "texture"), default="surface")
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument("--dynamic-resolution", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    game = Game(
+        {
+            "renderer": args.renderer,
+            "dirty_rects": args.dirty_rects,
+            "dynamic_resolution": args.dynamic_resolution,
+            "record": "",
+        }
+    )
+    scene = Scene(args.invaders, args.lasers, args.bombs, args.explosions)
+    times = run(game, scene, args.frames, args.warmup)
+
+    renderer = type(game.presenter).__name__
+    print(f"renderer: {renderer}, video driver: {pygame.display.get_driver()}")
+    print(
+        f"{args.frames} frames in {times['total']:.2f} s, "
+        f"{args.frames / times['total']:.1f} fps"
+    )
+    for phase in PHASES:
+        print(f"  {phase:<12}{times[phase] / args.frames * 1000:8.3f} ms/frame")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,22 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath('tools'))
+import pack_bundle
 
 
 block_cipher = None
 
+# every asset the game reads is packed in one memory-mapped bundle
+pack_bundle.main()
+
 
 a = Analysis(
     ['game.py'],
     pathex=[],
     binaries=[],
-    datas=[('src/assets/fonts/*', 'src/assets/fonts'), ('src/assets/images/*.png', 'src/assets/images'), ('src/assets/sounds/*', 'src/assets/sounds')],
+    datas=[('src/assets/assets.bundle', 'src/assets')],
     hiddenimports=['dnspython'],
     hookspath=[],
     hooksconfig={},
@@ -1,8 +1,12 @@
 import os
 import contextlib
-from time import time
+import threading
+from time import time, strftime, perf_counter
 from _thread import start_new_thread
 
+# the startup report counts the imports from here
+STARTED = perf_counter()
+
 # import pygame silently
 with contextlib.redirect_stdout(None):
     import pygame
@@ -12,44 +16,136 @@ with contextlib.redirect_stdout(None):
 from src.config import *
 from src.objects import *
 from src.engines import *
-from src.data import *
-from src.online import *
+from src.render import *
+from src.simulation import *
+from src.preloader import *
+from src.recorder import *
+from src.startup import *
+from src.ui import *
 from src.variables import *
 
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, options=None) -> None:
+        """initialize the game, options replace the configured ones"""
+        self.startup = StartupReport(STARTED)
+        self.startup.step("imports")
+
+        # get the configuration first, it holds the display and audio options
+        self.config = Config()
+        self.configured = self.config.get()
+        self.config.options.update(options or {})
+        self.startup.step("config")
+
+        Sound.pre_init(self.config.options)
         pygame.init()
+        self.startup.step("pygame")
 
         self.running = True
         self.width, self.height = WIDTH, HEIGHT
 
-        self.screen = pygame.display.set_mode(
-            (self.width, self.height), pygame.RESIZABLE
-        )
-        pygame.display.set_icon(Image("icon").image)
+        self.presenter = self.create_presenter()
+        self.screen = self.presenter.window
         pygame.display.set_caption("Space Invaders")
+        self.clock = pygame.time.Clock()
+        self.last_event = time()
+        self.recorder = None
+        self.startup.step("display")
+        self.sound = Sound(self.config.options["audio_buffer"])
+        self.startup.step("sound")
+
+        self.loading_screen()
+        pygame.display.set_icon(image_bank.get("icon"))
 
         self.background = Background()
         self.sidebar = SideBar()
         self.bosshealthbar = BossHealthBar()
-        self.sound = Sound()
-        self.clock = pygame.time.Clock()
+        self.dirty = DirtyRenderer()
+        self.queue = RenderQueue()
+        self.resolution = DynamicResolution((self.width, self.height))
+        self.startup.step("objects")
 
-        self.server = Server()
-        self.client = Client()
-        self.data = Data()
-        self.config = Config()
+        # the online, server and database subsystems are imported and created
+        # the first time they are needed, see the properties below
+        self.subsystems = {}
+        self.subsystems_lock = threading.Lock()
 
+        # the connection is checked once the menu is shown
         self.online = False
-        start_new_thread(self.check_connection, ())
+        self.checking_connection = False
 
         self.last_ip = ""
 
+    # subsystems
+    def get_subsystem(self, name: str, create):
+        """return a subsystem, create it the first time"""
+        subsystem = self.subsystems.get(name)
+        if subsystem is None:
+            with self.subsystems_lock:
+                subsystem = self.subsystems.get(name)
+                if subsystem is None:
+                    subsystem = self.subsystems[name] = create()
+        return subsystem
+
+    @property
+    def server(self):
+        """the server hosting local multiplayer games"""
+
+        def create():
+            from src.online import Server
+
+            return Server()
+
+        return self.get_subsystem("server", create)
+
+    @property
+    def client(self):
+        """the client of a local multiplayer game"""
+
+        def create():
+            from src.online import Client
+
+            return Client()
+
+        return self.get_subsystem("client", create)
+
+    @property
+    def data(self):
+        """the scores, saved in the database when online"""
+
+        def create():
+            from src.data import Data
+
+            return Data()
+
+        return self.get_subsystem("data", create)
+
+    def create_presenter(self) -> Presenter:
+        """create the presenter of the renderer chosen in the options, the
+        surface renderer is the fallback if the texture one isn't available"""
+        size = (self.width, self.height)
+        if self.config.options["renderer"] == "texture":
+            try:
+                return TextureRenderer(size)
+            except pygame.error:
+                pass
+        return Presenter(size, self.config.options["scaled_display"])
+
     # connection methods
+    def start_connection_check(self) -> None:
+        """start checking the connection and fetching the scores, only once"""
+        if not self.checking_connection:
+            self.checking_connection = True
+            start_new_thread(self.check_connection, ())
+
     def check_connection(self) -> None:
         """check if app can connect to internet, loop every second"""
-        Timer(1, self.check_connection).start()
+        from src.online import check_connection
+
+        threading.Timer(1, self.check_connection).start()
+        # the database subsystem starts connecting while the connection is
+        # checked the first time
+        data = self.data
 
         # variable to compare after
         online_before = self.online
@@ -57,24 +153,27 @@ class Game:
         self.online = check_connection()
         # if online and not before
         if self.online and not online_before:
-            if not self.data.connected:
-                self.data.connect_to_db()
-            if self.server.running:
-                self.server.close()
-            if self.client.connected:
-                self.client.disconnect()
+            if not data.connected and not data.connecting:
+                data.connect_to_db()
+            # only the server and client already started can be running
+            server = self.subsystems.get("server")
+            if server is not None and server.running:
+                server.close()
+            client = self.subsystems.get("client")
+            if client is not None and client.connected:
+                client.disconnect()
         # if not online and before
         elif not self.online and online_before:
-            if self.data.connected:
-                self.data.disconnect_from_db()
+            if data.connected:
+                data.disconnect_from_db()
 
         # updates
-        self.data.fetch_scores()
+        data.fetch_scores()
 
     # run and exit methods
     def run(self) -> None:
         """run the game"""
-        if self.config.get():
+        if self.configured:
             self.menu()
         else:
             self.welcome_screen()
@@ -82,38 +181,136 @@ class Game:
     def exit(self) -> None:
         """exit"""
         self.config.save()
+        if self.recorder is not None:
+            self.recorder.stop()
         self.running = False
         pygame.quit()
         os._exit(0)
 
+    # events and clock methods
+    def get_events(self) -> list:
+        """get the events, any event means the player isn't idle"""
+        events = pygame.event.get()
+        if events:
+            self.last_event = time()
+        return events
+
+    def tick(self, animated=False) -> int:
+        """tick the clock of a screen, when nothing is animated and the player
+        is idle, wait for an event for at most an idle frame"""
+        if animated or time() - self.last_event < IDLE_DELAY:
+            return self.clock.tick(60)
+        # the frame rate is a user option, at least one frame a second
+        idle_fps = max(1, self.config.options["idle_fps"])
+        event = pygame.event.wait(1000 // idle_fps)
+        if event.type != pygame.NOEVENT:
+            # put the waking event back in front of the events queued with it,
+            # without pumping new ones, they are handled on the next frame
+            for event in [event] + pygame.event.get(pump=False):
+                pygame.event.post(event)
+        return self.clock.tick()
+
     # draw and play_sounds methods
-    def draw_game(self, *objects) -> None:
-        """draw the game screen"""
-        for obj in objects:
-            if (
-                isinstance(obj, Image)
-                or isinstance(obj, Text)
-                or isinstance(obj, SideBar)
-                or isinstance(obj, BossHealthBar)
-                or isinstance(obj, Notification)
-            ):
-                self.background.image.blit(obj.image, (obj.x, obj.y))
-            elif isinstance(obj, dict):
-                image = Image(obj["image_name"])
-                self.background.image.blit(image.image, (obj["x"], obj["y"]))
-            elif obj is not None:
-                image = Image(obj.image_name)
-                self.background.image.blit(image.image, (obj.x, obj.y))
-
-        game = pygame.transform.scale(self.background.image, self.screen.get_size())
-        self.screen.blit(game, (0, 0))
+    def draw_game(self, *objects, playing=False) -> None:
+        """add the objects to the hud layer of the render queue and draw it,
+        playing screens can be drawn with dirty rects or a dynamic resolution"""
+        self.queue.add_objects("hud", objects)
+        options = self.config.options
+
+        # dirty rects need the background image and the screen at the game size
+        if (
+            playing
+            and options["dirty_rects"]
+            and self.presenter.compose
+            and self.screen.get_size() == (self.width, self.height)
+        ):
+            self.dirty.draw(
+                self.screen, self.background, self.queue, (self.sidebar.image,)
+            )
+        elif playing and options["dynamic_resolution"] and self.presenter.compose:
+            self.dirty.reset()
+            self.resolution.record(self.clock.get_rawtime())
+            self.presenter.present(self.resolution.draw(self.background, self.queue))
+        else:
+            self.dirty.reset()
+            self.presenter.draw(self.background, self.queue)
+        self.queue.clear()
+
+        if playing and options["record"]:
+            self.record()
+
+    def record(self) -> None:
+        """record the drawn frame, the recording starts with the first one"""
+        if self.recorder is None:
+            directory = os.path.join(
+                self.config.dir, "recordings", strftime("%Y-%m-%d_%H-%M-%S")
+            )
+            self.recorder = Recorder(
+                (self.width, self.height), directory, self.config.options["record"]
+            )
+            self.recorder.start()
+        self.recorder.capture(self.presenter.capture)
+
+    def update_display(self) -> None:
+        """push the drawn frame to the display"""
+        if self.dirty.active:
+            self.dirty.update_display()
+        else:
+            self.presenter.update_display()
+
+        if not self.startup.done:
+            self.first_frame()
+
+    def first_frame(self) -> None:
+        """report the startup time"""
+        self.startup.finish()
+        if self.config.options["startup_report"]:
+            print(self.startup.report())
 
     def play_sounds(self, *sounds) -> None:
-        """play sounds"""
-        for sound in sounds:
+        """play the sounds of a frame, the same sound is only played once"""
+        for sound in dict.fromkeys(sounds):
             self.sound.play(sound)
 
-    # welcome, menu, and game over screens
+    # loading, welcome, menu, and game over screens
+    def loading_screen(self) -> None:
+        """load every image, sound and font while showing the progress, the
+        files are decoded by a pool of threads"""
+        preloader = Preloader(
+            image_bank.get_jobs()
+            + self.sound.get_jobs()
+            + text_cache.get_jobs(FONT_PATH, FONT_SIZE)
+        )
+        image = pygame.Surface((self.width, self.height))
+        bar = pygame.Rect(self.width / 4, self.height / 2 - 10, self.width / 2, 20)
+
+        def draw() -> None:
+            """draw the progress bar"""
+            image.fill(BLACK)
+            pygame.draw.rect(image, WHITE, bar, 2)
+            progress = bar.inflate(-8, -8)
+            progress.width *= preloader.progress
+            pygame.draw.rect(image, WHITE, progress)
+            self.presenter.present(image)
+            self.presenter.update_display()
+
+        # show the window before the workers take their share of the cpu
+        draw()
+        self.startup.step("loading screen")
+        preloader.start()
+        drawn = perf_counter()
+        while not preloader.done:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.exit()
+            preloader.wait(1 / 60)
+            preloader.update()
+            # the files are added as soon as they are decoded, drawn at 60 fps
+            if perf_counter() - drawn >= 1 / 60:
+                drawn = perf_counter()
+                draw()
+        self.startup.step("assets")
+
     def welcome_screen(self) -> None:
         """welcome screen, ask player to enter their name"""
         title_obj = Image("title")
@@ -131,7 +328,7 @@ class Game:
         credits_obj.y = self.height - credits_obj.height - 10
 
         while self.running:
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -149,7 +346,7 @@ class Game:
                         self.config.name += event.unicode.upper()
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt, playing=False)
             input_obj.change_text(self.config.name + ("_" if time() % 1 > 0.5 else ""))
@@ -159,51 +356,67 @@ class Game:
             # display
             self.draw_game(title_obj, text_obj, input_obj, credits_obj)
 
-            pygame.display.update()
+            self.update_display()
 
     def menu(self) -> None:
         """menu screen of the game"""
+        selected = 0
+        line = line_height()
+
+        def option(index: int, text: str, y: float, needs_online=False) -> Label:
+            """return an option label, red when selected"""
+            return Label(
+                lambda: (
+                    text,
+                    INACTIVE_GREY
+                    if needs_online and not self.online
+                    else RED
+                    if selected == index
+                    else WHITE,
+                ),
+                self.width / 2,
+                y,
+            )
+
         title_obj = Image("title")
         title_obj.x = self.width / 2 - title_obj.width / 2
         title_obj.y = self.height / 4 - title_obj.height / 2.5
 
-        single_obj = Text("SINGLE-PLAYER", WHITE)
-        single_obj.x = self.width / 2 - single_obj.width / 2
-        single_obj.y = self.height * 0.75 - single_obj.height * 4
-
-        local_obj = Text("MULTI-PLAYER", WHITE)
-        local_obj.x = self.width / 2 - local_obj.width / 2
-        local_obj.y = self.height * 0.75 - local_obj.height * 2.5
-
-        online_obj = Text("LOCAL-MULTI", WHITE)
-        online_obj.x = self.width / 2 - online_obj.width / 2
-        online_obj.y = self.height * 0.75 - online_obj.height
-
-        leaderboard_obj = Text("LEADERBOARD", WHITE)
-        leaderboard_obj.x = self.width / 2 - leaderboard_obj.width / 2
-        leaderboard_obj.y = self.height * 0.75 + leaderboard_obj.height / 2
+        options = [
+            option(0, "SINGLE-PLAYER", self.height * 0.75 - line * 4),
+            option(1, "MULTI-PLAYER", self.height * 0.75 - line * 2.5),
+            option(2, "LOCAL-MULTI", self.height * 0.75 - line, True),
+            option(3, "LEADERBOARD", self.height * 0.75 + line / 2, True),
+            option(4, "SETTINGS", self.height * 0.75 + line * 2),
+        ]
 
-        settings_obj = Text("SETTINGS", WHITE)
-        settings_obj.x = self.width / 2 - settings_obj.width / 2
-        settings_obj.y = self.height * 0.75 + settings_obj.height * 2
-
-        connection_obj = Text("CONNECTED:", WHITE)
-        connection_obj.x = 10
-        connection_obj.y = self.height - connection_obj.height - 10
-
-        credits_obj = Text("©EMANUEL", WHITE)
-        credits_obj.x = self.width - credits_obj.width - 10
-        credits_obj.y = self.height - credits_obj.height - 10
-
-        arrow = Image("arrow")
+        connection_obj = Label(
+            ("CONNECTED:", WHITE), 10, self.height - line - 10, "left"
+        )
+        connection_v_obj = Label(
+            lambda: ("YES", GREEN) if self.online else ("NO", RED),
+            connection_obj.x + connection_obj.width + 5,
+            self.height - line - 10,
+            "left",
+        )
+        credits_obj = Label(
+            ("©EMANUEL", WHITE), self.width - 10, self.height - line - 10, "right"
+        )
 
-        # show fps at the top right corner
+        # the online options and the scores need the connection
+        self.start_connection_check()
 
-        selected = 0
+        ui = Layout(
+            *options,
+            Pointer(lambda: options[selected]),
+            connection_obj,
+            connection_v_obj,
+            credits_obj,
+        )
 
         while self.running:
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -236,55 +449,14 @@ class Game:
                 selected = 0
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt)
 
-            single_obj.change_color(RED if selected == 0 else WHITE)
-            local_obj.change_color(RED if selected == 1 else WHITE)
-            online_obj.change_color(
-                INACTIVE_GREY if not self.online else RED if selected == 2 else WHITE
-            )
-            leaderboard_obj.change_color(
-                INACTIVE_GREY if not self.online else RED if selected == 3 else WHITE
-            )
-            settings_obj.change_color(RED if selected == 4 else WHITE)
-
-            if selected == 0:
-                arrow.x = single_obj.x - arrow.width - 15
-                arrow.y = single_obj.y + 4
-            elif selected == 1:
-                arrow.x = local_obj.x - arrow.width - 15
-                arrow.y = local_obj.y + 4
-            elif selected == 2 and self.online:
-                arrow.x = online_obj.x - arrow.width - 15
-                arrow.y = online_obj.y + 4
-            elif selected == 3 and self.online:
-                arrow.x = leaderboard_obj.x - arrow.width - 15
-                arrow.y = leaderboard_obj.y + 4
-            elif selected == 4:
-                arrow.x = settings_obj.x - arrow.width - 15
-                arrow.y = settings_obj.y + 4
-
-            connection_v_obj = Text("YES", GREEN) if self.online else Text("NO", RED)
-            connection_v_obj.x = connection_obj.x + connection_obj.width + 5
-            connection_v_obj.y = self.height - connection_v_obj.height - 10
-
             # display
-            self.draw_game(
-                title_obj,
-                single_obj,
-                local_obj,
-                online_obj,
-                leaderboard_obj,
-                settings_obj,
-                arrow,
-                connection_obj,
-                connection_v_obj,
-                credits_obj,
-            )
+            self.draw_game(title_obj, *ui.update())
 
-            pygame.display.update()
+            self.update_display()
 
     def game_over(
         self, score1: int, score2: int, original_mode: str, name1=None, name2=None
@@ -348,7 +520,7 @@ class Game:
 
         while self.running:
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -405,180 +577,200 @@ class Game:
                 credits_obj,
             )
 
-            pygame.display.update()
+            self.update_display()
 
     # game modes and leaderboard screens
     def single_player(self) -> None:
         """single player game mode"""
         engine = SingleEngine()
         engine.player.change_style(self.config.style)
+        simulation = Simulation(
+            engine, engine.get_sounds, self.config.options["simulation_thread"]
+        )
+
+        def release(direction: str) -> None:
+            """stop the player if it still goes in the released direction"""
+            if engine.player.direction == direction:
+                engine.change_direction("")
 
         highscore = self.data.get_high_score("single")
 
+        simulation.start()
+        player = simulation.latest()["player"]
         while self.running:
-            # get sprites
-            player = engine.player
-            lasers = engine.lasers
-            invaders = engine.invaders
-            boss = engine.boss
-            bombs = engine.bombs
-            explosions = engine.explosions
-            sounds = engine.get_sounds()
-
-            highscore = max(highscore, player.score)
-
             # events
-            if player.life == 0:
+            if player["life"] == 0:
+                simulation.stop()
                 self.play_sounds("explosion")
                 self.game_over(
-                    score1=player.score,
+                    score1=player["score"],
                     score2=highscore,
                     original_mode="single",
                 )
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
+                    simulation.stop()
                     self.exit()
 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
+                        simulation.stop()
                         self.menu()
                     elif event.key == self.config.controls["left"]:
-                        engine.change_direction("left")
+                        simulation.send(engine.change_direction, "left")
                     elif event.key == self.config.controls["right"]:
-                        engine.change_direction("right")
+                        simulation.send(engine.change_direction, "right")
                     elif event.key == self.config.controls["shoot"]:
-                        engine.shoot_laser()
+                        simulation.send(engine.shoot_laser)
 
                 elif event.type == pygame.KEYUP:
-                    if (
-                        event.key == self.config.controls["left"]
-                        and player.direction == "left"
-                    ):
-                        engine.change_direction("")
-                    elif (
-                        event.key == self.config.controls["right"]
-                        and player.direction == "right"
-                    ):
-                        engine.change_direction("")
+                    if event.key == self.config.controls["left"]:
+                        simulation.send(release, "left")
+                    elif event.key == self.config.controls["right"]:
+                        simulation.send(release, "right")
 
             # updates
             dt = self.clock.tick(60)
+            simulation.step(dt)
+
+            # get the sprites of the latest snapshot, without a simulation
+            # thread it is the state of this frame
+            snapshot = simulation.latest()
+            player = snapshot["player"]
+            boss = snapshot["boss"]
+            sounds = simulation.pop_sounds()
+
+            highscore = max(highscore, player["score"])
 
             self.background.update(dt, playing=True)
             self.sidebar.update(
-                life=player.life,
-                score1=player.score,
+                life=player["life"],
+                score1=player["score"],
                 highscore=highscore,
             )
             self.bosshealthbar.update(boss)
-            engine.update(dt)
 
             # display and sounds
+            self.queue.add_sprites_data("background", snapshot["explosions"])
+            self.queue.add_particles_data(snapshot["particles"])
+            self.queue.add_sprites_data("enemies", snapshot["invaders"])
+            self.queue.add_sprites_data("enemies", (boss,))
+            self.queue.add_sprites_data("projectiles", snapshot["bombs"])
+            self.queue.add_sprites_data("projectiles", snapshot["lasers"])
+            self.queue.add_sprites_data("players", (player,))
             self.draw_game(
-                *explosions,
-                *invaders,
-                *bombs,
-                boss,
-                *lasers,
-                player,
                 self.sidebar,
-                self.bosshealthbar,
+                self.bosshealthbar if self.bosshealthbar.visible else None,
+                playing=True,
             )
             self.play_sounds(*sounds)
 
-            pygame.display.update()
+            self.update_display()
 
     def multi_player(self) -> None:
         """multiplayer game mode, the two players play on the same window"""
         engine = MultiEngine()
         engine.players[1].change_style(1)
+        simulation = Simulation(
+            engine,
+            lambda: engine.get_sounds(0),
+            self.config.options["simulation_thread"],
+        )
+
+        def release(playerId: int, direction: str) -> None:
+            """stop the player if it still goes in the released direction"""
+            if engine.players[playerId].direction == direction:
+                engine.change_direction(playerId, "")
 
         highscore = self.data.get_high_score("multi")
 
+        simulation.start()
+        player1, player2 = simulation.latest()["players"]
         while self.running:
-            # get sprites
-            player1 = engine.players[0]
-            player2 = engine.players[1]
-            lasers1 = engine.lasers[0]
-            lasers2 = engine.lasers[1]
-            invaders = engine.invaders
-            boss = engine.boss
-            bombs = engine.bombs
-            explosions = engine.explosions
-            sounds = engine.get_sounds(0)
-
-            highscore = max(highscore, player1.score + player2.score)
-
             # events
-            if player1.life == 0:
+            if player1["life"] == 0:
+                simulation.stop()
                 self.play_sounds("explosion")
                 self.game_over(
-                    score1=player1.score,
-                    score2=player2.score,
+                    score1=player1["score"],
+                    score2=player2["score"],
                     original_mode="multi",
                 )
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
+                    simulation.stop()
                     self.exit()
 
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
+                        simulation.stop()
                         self.menu()
                     # player1 checks
                     elif event.key == pygame.K_LEFT:
-                        engine.change_direction(0, "left")
+                        simulation.send(engine.change_direction, 0, "left")
                     elif event.key == pygame.K_RIGHT:
-                        engine.change_direction(0, "right")
+                        simulation.send(engine.change_direction, 0, "right")
                     elif event.key == pygame.K_UP:
-                        engine.shoot_laser(0)
+                        simulation.send(engine.shoot_laser, 0)
 
                     # player2 checks
                     elif event.key == pygame.K_q:
-                        engine.change_direction(1, "left")
+                        simulation.send(engine.change_direction, 1, "left")
                     elif event.key == pygame.K_d:
-                        engine.change_direction(1, "right")
+                        simulation.send(engine.change_direction, 1, "right")
                     elif event.key == pygame.K_z:
-                        engine.shoot_laser(1)
+                        simulation.send(engine.shoot_laser, 1)
 
                 elif event.type == pygame.KEYUP:
-                    if event.key == pygame.K_LEFT and player1.direction == "left":
-                        engine.change_direction(0, "")
-                    elif event.key == pygame.K_RIGHT and player1.direction == "right":
-                        engine.change_direction(0, "")
-                    elif event.key == pygame.K_q and player2.direction == "left":
-                        engine.change_direction(1, "")
-                    elif event.key == pygame.K_d and player2.direction == "right":
-                        engine.change_direction(1, "")
+                    if event.key == pygame.K_LEFT:
+                        simulation.send(release, 0, "left")
+                    elif event.key == pygame.K_RIGHT:
+                        simulation.send(release, 0, "right")
+                    elif event.key == pygame.K_q:
+                        simulation.send(release, 1, "left")
+                    elif event.key == pygame.K_d:
+                        simulation.send(release, 1, "right")
 
             # updates
             dt = self.clock.tick(60)
+            simulation.step(dt)
+
+            # get the sprites of the latest snapshot, without a simulation
+            # thread it is the state of this frame
+            snapshot = simulation.latest()
+            player1, player2 = snapshot["players"]
+            lasers1, lasers2 = snapshot["lasers"]
+            boss = snapshot["boss"]
+            sounds = simulation.pop_sounds()
+
+            highscore = max(highscore, player1["score"] + player2["score"])
 
             self.background.update(dt, playing=True)
             self.sidebar.update(
-                life=player1.life,
-                score1=player1.score,
+                life=player1["life"],
+                score1=player1["score"],
                 highscore=highscore,
-                score2=player2.score,
+                score2=player2["score"],
             )
             self.bosshealthbar.update(boss)
-            engine.update(dt)
 
             # display and sounds
+            self.queue.add_sprites_data("background", snapshot["explosions"])
+            self.queue.add_particles_data(snapshot["particles"])
+            self.queue.add_sprites_data("enemies", snapshot["invaders"])
+            self.queue.add_sprites_data("enemies", (boss,))
+            self.queue.add_sprites_data("projectiles", snapshot["bombs"])
+            self.queue.add_sprites_data("projectiles", lasers2)
+            self.queue.add_sprites_data("projectiles", lasers1)
+            self.queue.add_sprites_data("players", (player2, player1))
             self.draw_game(
-                *explosions,
-                *invaders,
-                *bombs,
-                boss,
-                *lasers2,
-                player2,
-                *lasers1,
-                player1,
                 self.sidebar,
-                self.bosshealthbar,
+                self.bosshealthbar if self.bosshealthbar.visible else None,
+                playing=True,
             )
             self.play_sounds(*sounds)
 
-            pygame.display.update()
+            self.update_display()
 
     def local_multi_player(self) -> None:
         """local multiplayer game mode, the two players can play on different screens/windows"""
@@ -630,7 +822,7 @@ class Game:
                     name2=name2,
                 )
 
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.client.disconnect()
                     self.exit()
@@ -676,43 +868,51 @@ class Game:
             request += f"update:{dt}|"
 
             # display and sounds
+            self.queue.add_sprites_data("background", explosions)
+            self.queue.add_sprites_data("enemies", invaders)
+            self.queue.add_sprites_data("enemies", (boss,))
+            self.queue.add_sprites_data("projectiles", bombs)
+            self.queue.add_sprites_data("projectiles", lasers_o)
+            self.queue.add_sprites_data("projectiles", lasers_p)
+            self.queue.add_sprites_data("players", (other, player))
             self.draw_game(
-                *explosions,
-                *invaders,
-                *bombs,
-                boss,
-                *lasers_o,
-                other,
-                *lasers_p,
-                player,
                 self.sidebar,
-                self.bosshealthbar,
+                self.bosshealthbar if self.bosshealthbar.visible else None,
+                playing=True,
             )
             self.play_sounds(*sounds)
 
-            pygame.display.update()
+            self.update_display()
 
     def leaderboard(self) -> None:
         """leaderboard screen, show off the 10 best scores"""
-        single_obj = Text("SINGLE", BLUE)
-        single_obj.x = self.width / 4 - single_obj.width / 2
-        single_obj.y = self.height / 10
-
-        multi_obj = Text("MULTI", BLUE)
-        multi_obj.x = self.width * 0.75 - multi_obj.width / 2
-        multi_obj.y = self.height / 10
-
-        ok_obj = Text("PRESS ANY KEY TO RETURN", WHITE)
-        ok_obj.x = self.width / 2 - ok_obj.width / 2
-        ok_obj.y = self.height / 10 * 8
-
-        credits_obj = Text("©EMANUEL", WHITE)
-        credits_obj.x = self.width / 2 - credits_obj.width / 2
-        credits_obj.y = self.height - credits_obj.height - 10
+        line = line_height()
+
+        def score(mode: str, i: int, x: float) -> Label:
+            """return the label of the i-th score of a mode"""
+
+            def bind() -> tuple:
+                scores = self.data.scores[mode]
+                if i < len(scores):
+                    return f"{i + 1}. {scores[i]['name']} - {scores[i]['score']}", WHITE
+                return f"{i + 1}. -----", INACTIVE_GREY
+
+            return Label(bind, x, self.height / 2 - line / 2 + (i - 5) * line)
+
+        ui = Layout(
+            Label(("SINGLE", BLUE), self.width / 4, self.height / 10),
+            Label(("MULTI", BLUE), self.width * 0.75, self.height / 10),
+            Layout(*[score("single", i, self.width / 4) for i in range(10)]),
+            Layout(*[score("multi", i, self.width * 0.75) for i in range(10)]),
+            Label(
+                ("PRESS ANY KEY TO RETURN", WHITE), self.width / 2, self.height / 10 * 8
+            ),
+            Label(("©EMANUEL", WHITE), self.width / 2, self.height - line - 10),
+        )
 
         while self.running:
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -720,125 +920,88 @@ class Game:
                     self.menu()
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt)
 
-            # get single scores
-            single_score_objs = []
-            for i in range(10):
-                if i < len(self.data.scores["single"]):
-                    obj = Text(
-                        f"{i + 1}. {self.data.scores['single'][i]['name']} - {self.data.scores['single'][i]['score']}",
-                        WHITE,
-                    )
-                else:
-                    obj = Text(f"{i + 1}. -----", INACTIVE_GREY)
-                obj.x = self.width / 4 - obj.width / 2
-                obj.y = self.height / 2 - obj.height / 2 + ((i - 5) * obj.height)
-
-                single_score_objs.append(obj)
-
-            # get multi scores
-            multi_score_objs = []
-            for i in range(10):
-                if i < len(self.data.scores["multi"]):
-                    obj = Text(
-                        f"{i + 1}. {self.data.scores['multi'][i]['name']} - {self.data.scores['multi'][i]['score']}",
-                        WHITE,
-                    )
-                else:
-                    obj = Text(f"{i + 1}. -----", INACTIVE_GREY)
-                obj.x = self.width * 0.75 - obj.width / 2
-                obj.y = self.height / 2 - obj.height / 2 + ((i - 5) * obj.height)
-
-                multi_score_objs.append(obj)
-
             # display
-            self.draw_game(
-                single_obj,
-                multi_obj,
-                *single_score_objs,
-                *multi_score_objs,
-                ok_obj,
-                credits_obj,
-            )
+            self.draw_game(*ui.update())
 
-            pygame.display.update()
+            self.update_display()
 
     def settings(self) -> None:
         """add the possibility to change name, style and config.controls"""
-        # align objects from the right
-        settings_obj = Text("SETTINGS", BLUE)
-        settings_obj.x = self.width / 2 - settings_obj.width / 2
-        settings_obj.y = self.height / 10
-
-        name_obj = Text("NAME:", WHITE)
-        name_obj.x = self.width / 2 - name_obj.width
-        name_obj.y = self.height / 10 * 2.25
-
-        name_input = Text(self.config.name, WHITE)
-        name_input.x = self.width / 2 + 25
-        name_input.y = self.height / 10 * 2.25
-
-        style_obj = Text("STYLE:", WHITE)
-        style_obj.x = self.width / 2 - style_obj.width
-        style_obj.y = self.height / 10 * 3.10
-
-        shoot_obj = Text("SHOOT:", WHITE)
-        shoot_obj.x = self.width / 2 - shoot_obj.width
-        shoot_obj.y = self.height / 10 * 3.95
-
-        shoot_key = Text("", WHITE)
-        shoot_key.x = self.width / 2 + 25
-        shoot_key.y = self.height / 10 * 3.95
-
-        left_obj = Text("LEFT:", WHITE)
-        left_obj.x = self.width / 2 - left_obj.width
-        left_obj.y = self.height / 10 * 4.80
-
-        left_key = Text("", WHITE)
-        left_key.x = self.width / 2 + 25
-        left_key.y = self.height / 10 * 4.80
-
-        right_obj = Text("RIGHT:", WHITE)
-        right_obj.x = self.width / 2 - right_obj.width
-        right_obj.y = self.height / 10 * 5.65
-
-        right_key = Text("", WHITE)
-        right_key.x = self.width / 2 + 25
-        right_key.y = self.height / 10 * 5.65
-
-        up_obj = Text("UP:", WHITE)
-        up_obj.x = self.width / 2 - up_obj.width
-        up_obj.y = self.height / 10 * 6.50
+        selected = 0
+        changing = False
 
-        up_key = Text("", WHITE)
-        up_key.x = self.width / 2 + 25
-        up_key.y = self.height / 10 * 6.50
+        def setting(index: int, text: str, y: float) -> Label:
+            """return a setting label aligned from the right, red when selected"""
+            return Label(
+                lambda: (text, RED if selected == index else WHITE),
+                self.width / 2,
+                y,
+                "right",
+            )
 
-        down_obj = Text("DOWN:", WHITE)
-        down_obj.x = self.width / 2 - down_obj.width
-        down_obj.y = self.height / 10 * 7.35
+        def control(name: str, y: float) -> Label:
+            """return the label of a control key"""
+            return Label(
+                lambda: (pygame.key.name(self.config.controls[name]).upper(), WHITE),
+                self.width / 2 + 25,
+                y,
+                "left",
+            )
 
-        down_key = Text("", WHITE)
-        down_key.x = self.width / 2 + 25
-        down_key.y = self.height / 10 * 7.35
+        settings = [
+            setting(0, "NAME:", self.height / 10 * 2.25),
+            setting(1, "STYLE:", self.height / 10 * 3.10),
+            setting(2, "SHOOT:", self.height / 10 * 3.95),
+            setting(3, "LEFT:", self.height / 10 * 4.80),
+            setting(4, "RIGHT:", self.height / 10 * 5.65),
+            setting(5, "UP:", self.height / 10 * 6.50),
+            setting(6, "DOWN:", self.height / 10 * 7.35),
+        ]
+
+        name_input = Label(
+            lambda: (
+                self.config.name
+                + ("_" if changing and selected == 0 and time() % 1 > 0.5 else ""),
+                GREEN if changing and selected == 0 else WHITE,
+            ),
+            self.width / 2 + 25,
+            self.height / 10 * 2.25,
+            "left",
+        )
+        style_example = Picture(
+            lambda: f"spaceship{self.config.style}",
+            self.width / 2 + 25,
+            self.height / 10 * 3.10 - 13,
+            "left",
+        )
 
-        escape_obj = Text("PRESS ENTER TO CHANGE AND ESCAPE TO RETURN", WHITE)
-        escape_obj.x = self.width / 2 - escape_obj.width / 2
-        escape_obj.y = self.height / 10 * 8.5
+        ui = Layout(
+            Label(("SETTINGS", BLUE), self.width / 2, self.height / 10),
+            Layout(*settings),
+            name_input,
+            style_example,
+            control("shoot", self.height / 10 * 3.95),
+            control("left", self.height / 10 * 4.80),
+            control("right", self.height / 10 * 5.65),
+            control("up", self.height / 10 * 6.50),
+            control("down", self.height / 10 * 7.35),
+            Label(
+                ("PRESS ENTER TO CHANGE AND ESCAPE TO RETURN", WHITE),
+                self.width / 2,
+                self.height / 10 * 8.5,
+            ),
+            Pointer(lambda: settings[selected]),
+        )
 
         notification_obj = Notification("PRESS A KEY!")
 
-        arrow = Image("arrow")
-
-        selected = 0
-        changing = False
-
         while self.running:
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -885,82 +1048,17 @@ class Game:
                             changing = False
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt)
 
-            style_example = Image(f"spaceship{self.config.style}")
-            style_example.x = self.width / 2 + 25
-            style_example.y = self.height / 10 * 3.10 - 13
-
-            name_input.change_text(
-                self.config.name
-                + ("_" if changing and selected == 0 and time() % 1 > 0.5 else "")
-            )
-            name_input.change_color(GREEN if changing and selected == 0 else WHITE)
-            shoot_key.change_text(
-                pygame.key.name(self.config.controls["shoot"]).upper()
-            )
-            left_key.change_text(pygame.key.name(self.config.controls["left"]).upper())
-            right_key.change_text(
-                pygame.key.name(self.config.controls["right"]).upper()
-            )
-            up_key.change_text(pygame.key.name(self.config.controls["up"]).upper())
-            down_key.change_text(pygame.key.name(self.config.controls["down"]).upper())
-
-            name_obj.change_color(RED if selected == 0 else WHITE)
-            style_obj.change_color(RED if selected == 1 else WHITE)
-            shoot_obj.change_color(RED if selected == 2 else WHITE)
-            left_obj.change_color(RED if selected == 3 else WHITE)
-            right_obj.change_color(RED if selected == 4 else WHITE)
-            up_obj.change_color(RED if selected == 5 else WHITE)
-            down_obj.change_color(RED if selected == 6 else WHITE)
-
-            if selected == 0:
-                arrow.x = name_obj.x - arrow.width - 15
-                arrow.y = name_obj.y + 4
-            elif selected == 1:
-                arrow.x = style_obj.x - arrow.width - 15
-                arrow.y = style_obj.y + 4
-            elif selected == 2:
-                arrow.x = shoot_obj.x - arrow.width - 15
-                arrow.y = shoot_obj.y + 4
-            elif selected == 3:
-                arrow.x = left_obj.x - arrow.width - 15
-                arrow.y = left_obj.y + 4
-            elif selected == 4:
-                arrow.x = right_obj.x - arrow.width - 15
-                arrow.y = right_obj.y + 4
-            elif selected == 5:
-                arrow.x = up_obj.x - arrow.width - 15
-                arrow.y = up_obj.y + 4
-            elif selected == 6:
-                arrow.x = down_obj.x - arrow.width - 15
-                arrow.y = down_obj.y + 4
-
             # display
             self.draw_game(
-                settings_obj,
-                name_obj,
-                name_input,
-                style_obj,
-                style_example,
-                shoot_obj,
-                shoot_key,
-                left_obj,
-                left_key,
-                right_obj,
-                right_key,
-                up_obj,
-                up_key,
-                down_obj,
-                down_key,
-                escape_obj,
-                arrow,
+                *ui.update(),
                 notification_obj if changing and selected > 1 else None,
             )
 
-            pygame.display.update()
+            self.update_display()
 
     # online mode methods/screens
     def host_or_join(self) -> None:
@@ -981,7 +1079,7 @@ class Game:
             if not self.online:
                 self.error_screen("CONNECTION UNAVAILABLE", "menu")
 
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -999,7 +1097,7 @@ class Game:
                             self.join()
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt)
 
@@ -1016,7 +1114,7 @@ class Game:
             # display
             self.draw_game(host_obj, join_obj, arrow)
 
-            pygame.display.update()
+            self.update_display()
 
     def host(self) -> None:
         """host game and connect to it"""
@@ -1074,7 +1172,7 @@ class Game:
                 connecting_since = 0
                 input_ip = ""
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -1126,7 +1224,7 @@ class Game:
             # display
             self.draw_game(connection_obj, input_obj, cursor_obj, valid_obj)
 
-            pygame.display.update()
+            self.update_display()
 
         # save ip
         self.last_ip = input_ip
@@ -1169,7 +1267,7 @@ class Game:
                 self.error_screen("CONNECTION LOST", "menu")
 
             # events
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     if self.server.running:
                         self.server.close()
@@ -1184,7 +1282,7 @@ class Game:
                         self.host_or_join()
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick(animated=ready)
 
             self.background.update(dt, playing=False)
 
@@ -1203,7 +1301,7 @@ class Game:
             # display
             self.draw_game(message_obj, ip_obj, quit_obj, waiting_obj)
 
-            pygame.display.update()
+            self.update_display()
 
     # error method
     def error_screen(self, error: str, redirect: str) -> None:
@@ -1217,7 +1315,7 @@ class Game:
         ok_obj.y = self.height / 2 + ok_obj.height
 
         while self.running:
-            for event in pygame.event.get():
+            for event in self.get_events():
                 if event.type == pygame.QUIT:
                     self.exit()
 
@@ -1236,14 +1334,15 @@ class Game:
                         self.settings()
 
             # updates
-            dt = self.clock.tick(60)
+            dt = self.tick()
 
             self.background.update(dt, playing=False)
 
             # display
             self.draw_game(error_obj, ok_obj)
 
-            pygame.display.update()
+            self.update_display()
 
 
-Game().run()
+if __name__ == "__main__":
+    Game().run()
@@ -1,6 +1,18 @@
 import os
+import pygame
 from src.variables import *
 
+# the keys are the only part of the configuration needing pygame, the
+# variables are shared with the engines, which don't import it
+CONTROLS = {
+    "enter": pygame.K_RETURN,
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "shoot": pygame.K_SPACE,
+}
+
 
 class Config:
     def __init__(self) -> None:
@@ -8,6 +20,7 @@ class Config:
         self.name = ""
         self.style = 0
         self.controls = CONTROLS
+        self.options = dict(OPTIONS)
         self.find_path()
 
     def find_path(self):
@@ -32,6 +45,8 @@ class Config:
                 self.name = config["name"]
                 self.style = config["style"]
                 self.controls = config["controls"]
+                # options are optional to keep older config files working
+                self.options.update(config.get("options", {}))
                 return True
         except:
             return False
@@ -45,5 +60,10 @@ class Config:
             os.makedirs(self.dir, exist_ok=True)
         # write the configuration to the file
         with open(self.path, "w") as config_file:
-            config = {"name": self.name, "style": self.style, "controls": self.controls}
+            config = {
+                "name": self.name,
+                "style": self.style,
+                "controls": self.controls,
+                "options": self.options,
+            }
             config_file.write(str(config))
@@ -1,5 +1,4 @@
-import certifi
-import pymongo
+import threading
 from _thread import start_new_thread
 
 
@@ -11,17 +10,37 @@ class Data:
         self.db_string = "mongodb+srv://emanuel:<secret>@cluster0.ppsbo.mongodb.net/myFirstDatabase?retryWrites=true&w=majority"
         self.db = None
         self.connected = False
+        # scores saved while connecting, inserted once connected
+        self.connecting = True
+        self.pending = []
+        self.lock = threading.Lock()
         start_new_thread(self.connect_to_db, ())
 
     def connect_to_db(self):
-        """try to connect to the database"""
+        """try to connect to the database, then insert the scores saved while
+        connecting"""
+        with self.lock:
+            self.connecting = True
         try:
+            # the database drivers are only imported to connect
+            import certifi
+            import pymongo
+
             client = pymongo.MongoClient(self.db_string, tlsCAFile=certifi.where())
             self.db = client["SpaceInvaders"]
-            self.connected = True
+            with self.lock:
+                self.connected = True
+                pending, self.pending = self.pending, []
+            for mode, name, score in pending:
+                self.db[mode].insert_one({"name": name, "score": score})
             self.fetch_scores()
         except:
             self.connected = False
+        finally:
+            # without a connection the scores saved meanwhile stay local
+            with self.lock:
+                self.connecting = False
+                self.pending = []
 
     def disconnect_from_db(self):
         """disconnect from the database, if connected"""
@@ -50,5 +69,9 @@ class Data:
         if len(self.scores[mode]) < 10 or score > self.scores[mode][9]["score"]:
             self.scores[mode].append({"name": name, "score": score})
             self.scores[mode].sort(key=lambda x: x["score"], reverse=True)
-            if self.connected:
+            with self.lock:
+                connected = self.connected
+                if not connected and self.connecting:
+                    self.pending.append((mode, name, score))
+            if connected:
                 self.db[mode].insert_one({"name": name, "score": score})
@@ -1,6 +1,49 @@
 from src.sprites import Player, Laser, Invader, Boss, Bomb, Explosion
-from src.variables import N_INVADERS, GAME_WIDTH, GAME_HEIGHT
-from threading import Timer
+from src.scheduler import Scheduler
+from src.variables import N_INVADERS, GAME_WIDTH, GAME_HEIGHT, PARTICLES_CAPACITY
+
+
+class Pool:
+    def __init__(self, sprite_class) -> None:
+        """initialize a pool of sprites, the released ones are reset and
+        reused instead of allocating new ones"""
+        self.sprite_class = sprite_class
+        self.free = []
+        self.allocated = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """return an active sprite made with args"""
+        if self.free:
+            sprite = self.free.pop()
+            sprite.activate(*args)
+            self.reused += 1
+        else:
+            sprite = self.sprite_class(*args)
+            self.allocated += 1
+        return sprite
+
+    def release(self, sprite) -> None:
+        """put a sprite no longer used back in the pool"""
+        if sprite.active:
+            sprite.deactivate()
+            self.free.append(sprite)
+
+    def stats(self) -> dict:
+        """return the allocated and reused sprites counts"""
+        return {
+            "allocated": self.allocated,
+            "reused": self.reused,
+            "free": len(self.free),
+        }
+
+
+def get_sprites_data(sprites) -> list:
+    """return the data needed to draw the sprites"""
+    return [
+        {"image_name": sprite.image_name, "x": sprite.x, "y": sprite.y}
+        for sprite in sprites
+    ]
 
 
 class SingleEngine:
@@ -8,14 +51,25 @@ class SingleEngine:
         """initialize the game"""
         self.gamew, self.gameh = GAME_WIDTH, GAME_HEIGHT
 
+        # pools of the sprites created and removed while playing
+        self.laser_pool = Pool(Laser)
+        self.bomb_pool = Pool(Bomb)
+        self.explosion_pool = Pool(Explosion)
+
         # sprites
         self.player = Player()
-        self.lasers = [Laser(self.player)]
+        self.lasers = [self.laser_pool.acquire(self.player)]
         self.invaders = [Invader() for i in range(N_INVADERS)]
         self.boss = Boss()
         self.bombs = []  # type: list[Bomb]
         self.explosions = []  # type: list[Explosion]
+        # numpy is only imported once a game starts
+        from src.particles import Particles
+
+        self.particles = Particles()
         self.sounds = []
+        # cooldowns, bombs and explosions run on the game time
+        self.scheduler = Scheduler()
 
         # score goals
         self.invader_goal = 100
@@ -27,6 +81,7 @@ class SingleEngine:
 
     def update(self, dt: int) -> None:
         """update game state"""
+        self.scheduler.update(dt)
         self.player.move(dt)
         for laser in self.lasers:
             laser.move(dt)
@@ -35,6 +90,7 @@ class SingleEngine:
         self.boss.move(dt)
         for bomb in self.bombs:
             bomb.move(dt)
+        self.particles.update(dt)
 
         self.check_invader_collisions()
         self.check_laser_collisions()
@@ -44,25 +100,28 @@ class SingleEngine:
 
     def add_laser(self) -> None:
         """add a laser"""
-        self.lasers.append(Laser(self.player))
+        self.lasers.append(self.laser_pool.acquire(self.player))
 
     def add_explosion(self, x: int, y: int) -> None:
         """add an explosion to the explosions list"""
-        self.explosions.append(Explosion(x, y, 0.3))
+        explosion = self.explosion_pool.acquire(x, y, 0.3)
+        self.explosions.append(explosion)
+        self.scheduler.schedule(explosion.lifetime, explosion.set_over)
+        self.particles.burst(x + 32, y + 32)
 
     def shoot_laser(self) -> None:
         """shoot a laser if possible"""
         if self.lasers != [] and not self.lasers[-1].shot:
             self.add_sound("shoot")
             self.lasers[-1].shoot()
-            Timer(0.6, self.add_laser).start()
+            self.scheduler.schedule(0.6, self.add_laser)
 
     def shoot_bomb(self) -> None:
         """shoot a bomb every 5 seconds when the boss is alive"""
         if self.boss.alive:
             self.add_sound("bomb")
-            self.bombs.append(Bomb(self.boss))
-            Timer(4, self.shoot_bomb).start()
+            self.bombs.append(self.bomb_pool.acquire(self.boss))
+            self.scheduler.schedule(4, self.shoot_bomb)
 
     def check_invader_collisions(self) -> None:
         """check if an invader collides with the player, crashes, or dies"""
@@ -81,7 +140,7 @@ class SingleEngine:
         for i in range(len(self.lasers) - 1, -1, -1):
             laser = self.lasers[i]
             if laser.y + laser.height <= 0:
-                self.lasers.pop(i)
+                self.laser_pool.release(self.lasers.pop(i))
 
         # check if a laser collides with an invader
         for i in range(len(self.lasers) - 1, -1, -1):
@@ -93,7 +152,7 @@ class SingleEngine:
                         self.add_sound("killed")
                         self.player.add_points(invader.type + 1)
                         invader.die()
-                        self.lasers.pop(i)
+                        self.laser_pool.release(self.lasers.pop(i))
                         break
 
         # check if a laser collides with a bomb
@@ -103,10 +162,10 @@ class SingleEngine:
                 for j in range(len(self.bombs) - 1, -1, -1):
                     bomb = self.bombs[j]
                     if laser.collide(bomb):
-                        self.bombs.pop(j)
+                        self.bomb_pool.release(self.bombs.pop(j))
                         self.add_explosion(bomb.x, bomb.y)
                         self.add_sound("killed")
-                        self.lasers.pop(i)
+                        self.laser_pool.release(self.lasers.pop(i))
                         self.player.add_points(1)
                         break
 
@@ -116,7 +175,7 @@ class SingleEngine:
             if laser.shot and self.boss.alive and laser.collide(self.boss):
                 self.boss.life -= 1
                 self.add_explosion(laser.x - 32, laser.y - laser.height / 2)
-                self.lasers.pop(i)
+                self.laser_pool.release(self.lasers.pop(i))
                 self.add_sound("killed")
                 if self.boss.life == 0:
                     self.add_sound("boss")
@@ -129,18 +188,18 @@ class SingleEngine:
             bomb = self.bombs[i]
             # check if bomb is out of screen
             if bomb.y > self.gameh:
-                self.bombs.pop(i)
+                self.bomb_pool.release(self.bombs.pop(i))
             elif bomb.collide(self.player):
                 self.player.life -= 1
                 self.add_sound("explosion")
                 self.add_explosion(bomb.x, bomb.y)
-                self.bombs.pop(i)
+                self.bomb_pool.release(self.bombs.pop(i))
 
     def check_explosions(self) -> None:
         """check if an explosion is over"""
         for i in range(len(self.explosions) - 1, -1, -1):
             if self.explosions[i].over:
-                self.explosions.pop(i)
+                self.explosion_pool.release(self.explosions.pop(i))
 
     def check_scores(self) -> None:
         """check if the scores should pop an event"""
@@ -152,7 +211,7 @@ class SingleEngine:
             self.boss_goal += 200
             self.boss.appear()
             self.add_sound("boss")
-            Timer(4, self.shoot_bomb).start()
+            self.scheduler.schedule(4, self.shoot_bomb)
 
     def add_sound(self, sound: str) -> None:
         """add a sound to the sounds list"""
@@ -164,20 +223,69 @@ class SingleEngine:
         self.sounds = []
         return sounds
 
+    def stats(self) -> dict:
+        """return the counters of the sprite pools"""
+        return {
+            "lasers": self.laser_pool.stats(),
+            "bombs": self.bomb_pool.stats(),
+            "explosions": self.explosion_pool.stats(),
+        }
+
+    def get_snapshot(self) -> dict:
+        """return the data needed to draw the game, made of new objects
+        never modified afterwards, so it can be drawn from another thread"""
+        player = self.player
+        boss = self.boss
+        return {
+            "player": {
+                "image_name": player.image_name,
+                "x": player.x,
+                "y": player.y,
+                "direction": player.direction,
+                "score": player.score,
+                "life": player.life,
+            },
+            "lasers": get_sprites_data(self.lasers),
+            "invaders": get_sprites_data(self.invaders),
+            "boss": {
+                "image_name": boss.image_name,
+                "x": boss.x,
+                "y": boss.y,
+                "life": boss.life,
+                "alive": boss.alive,
+            },
+            "bombs": get_sprites_data(self.bombs),
+            "explosions": get_sprites_data(self.explosions),
+            "particles": self.particles.get_data(),
+        }
+
 
 class MultiEngine:
-    def __init__(self) -> None:
-        """initialize the game"""
+    def __init__(self, effects=True) -> None:
+        """initialize the game, a server doesn't need the visual effects"""
         self.gamew, self.gameh = GAME_WIDTH, GAME_HEIGHT
 
+        # pools of the sprites created and removed while playing
+        self.laser_pool = Pool(Laser)
+        self.bomb_pool = Pool(Bomb)
+        self.explosion_pool = Pool(Explosion)
+
         # sprites
         self.players = [Player(), Player()]
-        self.lasers = [[Laser(self.players[0])], [Laser(self.players[1])]]
+        self.lasers = [
+            [self.laser_pool.acquire(self.players[0])],
+            [self.laser_pool.acquire(self.players[1])],
+        ]
         self.invaders = [Invader() for i in range(int(N_INVADERS * 2.5))]
         self.boss = Boss()
         self.bombs = []  # type: list[Bomb]
         self.explosions = []  # type: list[Explosion]
+        from src.particles import Particles
+
+        self.particles = Particles(PARTICLES_CAPACITY if effects else 0)
         self.sounds = [[], []]
+        # cooldowns, bombs and explosions run on the game time
+        self.scheduler = Scheduler()
 
         # score goals
         self.invader_goal = 100
@@ -194,6 +302,7 @@ class MultiEngine:
 
     def update(self, dt: int) -> None:
         """update game state"""
+        self.scheduler.update(dt)
         for player in self.players:
             player.move(dt)
         for laser in self.lasers[0] + self.lasers[1]:
@@ -203,6 +312,7 @@ class MultiEngine:
         self.boss.move(dt)
         for bomb in self.bombs:
             bomb.move(dt)
+        self.particles.update(dt)
 
         self.check_invader_collisions()
         self.check_laser_collisions(0)
@@ -213,25 +323,28 @@ class MultiEngine:
 
     def add_laser(self, playerId: int) -> None:
         """add a laser to the player lasers"""
-        self.lasers[playerId].append(Laser(self.players[playerId]))
+        self.lasers[playerId].append(self.laser_pool.acquire(self.players[playerId]))
 
     def add_explosion(self, x: int, y: int) -> None:
         """add an explosion to the explosions list"""
-        self.explosions.append(Explosion(x, y, 0.3))
+        explosion = self.explosion_pool.acquire(x, y, 0.3)
+        self.explosions.append(explosion)
+        self.scheduler.schedule(explosion.lifetime, explosion.set_over)
+        self.particles.burst(x + 32, y + 32)
 
     def shoot_laser(self, playerId: int) -> None:
         """shoot a laser if possible"""
         if self.lasers[playerId] != [] and not self.lasers[playerId][-1].shot:
             self.add_sound("shoot")
             self.lasers[playerId][-1].shoot()
-            Timer(0.6, self.add_laser, [playerId]).start()
+            self.scheduler.schedule(0.6, self.add_laser, playerId)
 
     def shoot_bomb(self) -> None:
         """shoot a bomb every 5 seconds when the boss is alive"""
         if self.boss.alive:
             self.add_sound("bomb")
-            self.bombs.append(Bomb(self.boss))
-            Timer(4, self.shoot_bomb).start()
+            self.bombs.append(self.bomb_pool.acquire(self.boss))
+            self.scheduler.schedule(4, self.shoot_bomb)
 
     def check_invader_collisions(self) -> None:
         """check if an invader collides with the players or crashes"""
@@ -252,7 +365,7 @@ class MultiEngine:
         for i in range(len(self.lasers[playerId]) - 1, -1, -1):
             laser = self.lasers[playerId][i]
             if laser.y + laser.height < 0:
-                self.lasers[playerId].pop(i)
+                self.laser_pool.release(self.lasers[playerId].pop(i))
 
         # check if laser collides with invader
         for i in range(len(self.lasers[playerId]) - 1, -1, -1):
@@ -262,7 +375,7 @@ class MultiEngine:
                     if laser.collide(invader):
                         self.add_explosion(invader.x, invader.y)
                         self.add_sound("killed")
-                        self.lasers[playerId].pop(i)
+                        self.laser_pool.release(self.lasers[playerId].pop(i))
                         self.players[playerId].add_points(invader.type + 1)
                         invader.die()
                         break
@@ -276,8 +389,8 @@ class MultiEngine:
                     if laser.collide(bomb):
                         self.add_explosion(bomb.x, bomb.y)
                         self.add_sound("explosion")
-                        self.bombs.pop(j)
-                        self.lasers[playerId].pop(i)
+                        self.bomb_pool.release(self.bombs.pop(j))
+                        self.laser_pool.release(self.lasers[playerId].pop(i))
                         self.players[playerId].add_points(1)
                         break
 
@@ -288,7 +401,7 @@ class MultiEngine:
                 self.boss.life -= 1
                 self.add_explosion(laser.x - 32, laser.y - laser.height / 2)
                 self.add_sound("killed")
-                self.lasers[playerId].pop(i)
+                self.laser_pool.release(self.lasers[playerId].pop(i))
                 if self.boss.life == 0:
                     self.add_sound("boss")
                     self.boss.die()
@@ -300,21 +413,21 @@ class MultiEngine:
             bomb = self.bombs[i]
             # check if bomb is out of screen
             if bomb.y > self.gameh:
-                self.bombs.pop(i)
+                self.bomb_pool.release(self.bombs.pop(i))
             elif (
                 bomb.collide(self.players[0]) or bomb.collide(self.players[1])
             ) and self.players[0].life > 0:
                 self.add_explosion(bomb.x, bomb.y)
                 self.add_sound("explosion")
                 self.players[0].life -= 1
-                self.bombs.pop(i)
+                self.bomb_pool.release(self.bombs.pop(i))
 
     def check_explosions(self) -> None:
         """check if an explosion is over"""
         for i in range(len(self.explosions) - 1, -1, -1):
             explosion = self.explosions[i]
             if explosion.over:
-                self.explosions.pop(i)
+                self.explosion_pool.release(self.explosions.pop(i))
 
     def check_scores(self) -> None:
         """check if the scores should pop an event"""
@@ -326,7 +439,7 @@ class MultiEngine:
             self.boss_goal += 300
             self.boss.appear()
             self.add_sound("boss")
-            Timer(4, self.shoot_bomb).start()
+            self.scheduler.schedule(4, self.shoot_bomb)
 
     def add_sound(self, sound: str) -> None:
         """add a sound to the sounds list"""
@@ -377,6 +490,7 @@ class MultiEngine:
             "x": boss.x,
             "y": boss.y,
             "life": boss.life,
+            "alive": boss.alive,
         }
 
     def get_bombs_data(self) -> dict:
@@ -399,6 +513,27 @@ class MultiEngine:
         self.sounds[playerId] = []
         return sounds
 
+    def stats(self) -> dict:
+        """return the counters of the sprite pools"""
+        return {
+            "lasers": self.laser_pool.stats(),
+            "bombs": self.bomb_pool.stats(),
+            "explosions": self.explosion_pool.stats(),
+        }
+
+    def get_snapshot(self) -> dict:
+        """return the data needed to draw the game, made of new objects
+        never modified afterwards, so it can be drawn from another thread"""
+        return {
+            "players": self.get_players_data(),
+            "lasers": self.get_lasers_data(),
+            "invaders": self.get_invaders_data(),
+            "boss": self.get_boss_data(),
+            "bombs": self.get_bombs_data(),
+            "explosions": self.get_explosions_data(),
+            "particles": self.particles.get_data(),
+        }
+
     def get_data(self, playerId: int) -> dict:
         """return all the needed game data"""
         return {
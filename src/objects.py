@@ -1,7 +1,13 @@
+import io
 import os
 import sys
+import json
+import mmap
 import random
+import struct
 import pygame
+from collections import OrderedDict
+from functools import partial
 from src.sprites import Boss
 from src.variables import *
 
@@ -17,38 +23,179 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+class AssetBundle:
+    def __init__(self, path: str) -> None:
+        """map the bundle packed by tools/pack_bundle.py in memory, its index
+        gives the (offset, size) of each file by relative path"""
+        with open(path, "rb") as bundle_file:
+            self.data = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+        start = len(BUNDLE_MAGIC)
+        if self.data[:start] != BUNDLE_MAGIC:
+            raise ValueError(f"{path} is not an asset bundle")
+        (length,) = struct.unpack("<I", self.data[start : start + 4])
+        self.index = json.loads(self.data[start + 4 : start + 4 + length])
+        # the files are sliced from the mapping without being copied
+        self.view = memoryview(self.data)
+
+    def read(self, relative_path: str) -> memoryview:
+        """return the content of a file"""
+        offset, size = self.index[relative_path]
+        return self.view[offset : offset + size]
+
+    def listdir(self, relative_path: str) -> list:
+        """return the names of the files of a directory"""
+        directory = relative_path.rstrip("/") + "/"
+        return [
+            path[len(directory) :]
+            for path in self.index
+            if path.startswith(directory) and "/" not in path[len(directory) :]
+        ]
+
+
+def load_bundle() -> AssetBundle:
+    """map the asset bundle of the executable, during development the assets
+    are loose files, even if a bundle was built"""
+    if not getattr(sys, "frozen", False):
+        return None
+    bundle_path = resource_path(BUNDLE_PATH)
+    return AssetBundle(bundle_path) if os.path.isfile(bundle_path) else None
+
+
+bundle = load_bundle()
+
+
+def resource_exists(relative_path: str) -> bool:
+    """return True if the asset is in the bundle or is a loose file"""
+    if bundle is not None and relative_path in bundle.index:
+        return True
+    return os.path.isfile(resource_path(relative_path))
+
+
+def resource_listdir(relative_path: str) -> list:
+    """return the names of the assets of a directory, bundled or loose"""
+    names = set(bundle.listdir(relative_path)) if bundle is not None else set()
+    directory = resource_path(relative_path)
+    if os.path.isdir(directory):
+        names.update(os.listdir(directory))
+    return sorted(names)
+
+
+def resource_read(relative_path: str) -> bytes:
+    """return the content of an asset, a view of the bundle if it is in it"""
+    if bundle is not None and relative_path in bundle.index:
+        return bundle.read(relative_path)
+    with open(resource_path(relative_path), "rb") as resource_file:
+        return resource_file.read()
+
+
+def resource_open(relative_path: str) -> io.BytesIO:
+    """return an asset as a file object"""
+    return io.BytesIO(resource_read(relative_path))
+
+
+def load_image(relative_path: str) -> pygame.Surface:
+    """load an image asset, the name hints its format"""
+    return pygame.image.load(resource_open(relative_path), relative_path)
+
+
+def load_sound(relative_path: str) -> pygame.mixer.Sound:
+    """decode a sound asset"""
+    return pygame.mixer.Sound(file=resource_open(relative_path))
+
+
 class Background:
     def __init__(self) -> None:
         """initialize background"""
         self.width, self.height = WIDTH, HEIGHT
         self.gamew, self.gameh = GAME_WIDTH, GAME_HEIGHT
         self.image = pygame.Surface((self.width, self.height))
-        self.stars = [
-            [
-                random.randrange(self.width),
-                random.randrange(self.height),
-                random.random() / 20,
-            ]
-            for i in range(N_STARS)
+        # star positions of each layer, to redraw only the stars that moved
+        self.stars = []  # type: list[list[tuple]]
+        # star layers as [image, speed, offset], from the farthest to the nearest
+        self.layers = [self.create_layer(i) for i in range(N_STAR_LAYERS)]
+        # offsets of the layers last drawn on the image
+        self.drawn_offsets = [0] * N_STAR_LAYERS
+        self.playing = False
+
+    def create_layer(self, depth: int) -> list:
+        """pre-render a layer of stars, nearer layers are brighter and faster"""
+        ratio = (depth + 1) / N_STAR_LAYERS
+        color = tuple(int(c * (0.4 + 0.6 * ratio)) for c in WHITE)
+        image = pygame.Surface((self.width, self.height)).convert()
+        image.fill(BLACK)
+        stars = [
+            (random.randrange(self.width), random.randrange(self.height))
+            for i in range(N_STARS // N_STAR_LAYERS)
         ]
+        for star in stars:
+            image.set_at(star, color)
+        self.stars.append(stars)
+        # the farthest layer is opaque and clears the background, the others
+        # are sparse and blit fast with a run-length encoded colorkey
+        if depth > 0:
+            image.set_colorkey(BLACK, pygame.RLEACCEL)
+        return [image, ratio / 20, 0]
 
     def update(self, dt: int, playing=False) -> None:
-        """update the background and move the stars"""
-        self.image.fill(BLACK)
-        for star in self.stars:
-            pygame.draw.line(self.image, WHITE, (star[0], star[1]), (star[0], star[1]))
-            star[1] += star[2] * dt
-            if star[1] > self.height:
-                star[0] = random.randrange(self.width)
-                star[1] = 0
-        if playing:
-            pygame.draw.line(
-                self.image,
-                RED,
-                (20, self.gameh - 20),
-                (self.gamew - 20, self.gameh - 20),
-                3,
-            )
+        """update the background and scroll the star layers, the renderer
+        draws them when it needs to"""
+        self.playing = playing
+        for layer in self.layers:
+            layer[2] = (layer[2] + layer[1] * dt) % self.height
+
+    def draw(self) -> None:
+        """draw the star layers on the image"""
+        for image, speed, offset in self.layers:
+            # the layer wraps around, blit it twice to fill the background
+            y = int(offset)
+            self.image.blit(image, (0, y))
+            self.image.blit(image, (0, y - self.height))
+        self.drawn_offsets = [int(offset) for image, speed, offset in self.layers]
+        if self.playing:
+            self.draw_line()
+
+    def draw_moved_stars(self) -> list:
+        """redraw the image only where stars of the game area moved since it
+        was drawn, return the redrawn rects"""
+        rects = []
+        for (image, speed, offset), stars, drawn in zip(
+            self.layers, self.stars, self.drawn_offsets
+        ):
+            y = int(offset)
+            if y == drawn:
+                continue
+            for star_x, star_y in stars:
+                if star_x < self.gamew:
+                    rects.append(
+                        pygame.Rect(star_x, (star_y + drawn) % self.height, 1, 1)
+                    )
+                    rects.append(pygame.Rect(star_x, (star_y + y) % self.height, 1, 1))
+        if not rects:
+            return rects
+
+        # each pixel is drawn from every layer, the farthest one is opaque
+        self.drawn_offsets = [int(offset) for image, speed, offset in self.layers]
+        self.image.blits(
+            [
+                (image, rect, (rect.x, (rect.y - y) % self.height, 1, 1))
+                for rect in rects
+                for (image, speed, offset), y in zip(self.layers, self.drawn_offsets)
+            ],
+            False,
+        )
+        if self.playing:
+            self.draw_line()
+        return rects
+
+    def draw_line(self) -> None:
+        """draw the line the invaders must not cross"""
+        pygame.draw.line(
+            self.image,
+            RED,
+            (20, self.gameh - 20),
+            (self.gamew - 20, self.gameh - 20),
+            3,
+        )
 
 
 class SideBar:
@@ -58,6 +205,20 @@ class SideBar:
         self.image = pygame.Surface((self.width, self.height))
         self.x, self.y = GAME_WIDTH, 0
 
+        # objects of the side bar, kept between updates
+        self.score1_obj = Text("SCORE-1:", WHITE)
+        self.score1_v_obj = Text("", WHITE)
+        self.hscore_obj = Text("HI-SCORE:", WHITE)
+        self.hscore_v_obj = Text("", WHITE)
+        self.score2_obj = Text("SCORE-2:", WHITE)
+        self.score2_v_obj = Text("", WHITE)
+        self.life_obj = Text("LIFE:", WHITE)
+        self.life_v_obj = None
+
+        # last values drawn, the side bar is only redrawn when they change
+        self.values = None
+        self.changed = True
+
     def update(
         self,
         life: int,
@@ -67,52 +228,59 @@ class SideBar:
         name1=None,
         name2=None,
     ) -> None:
-        """update the side bar"""
+        """update the side bar if one of its values changed"""
+        values = (life, score1, highscore, score2, name1, name2)
+        self.changed = values != self.values
+        if not self.changed:
+            return
+        self.values = values
+
         self.image.fill(BLACK)
         pygame.draw.line(self.image, WHITE, (3, 0), (3, self.height), 3)
 
-        # create objects for the side bar
-        score1_obj = Text("SCORE-1:" if name1 is None else name1, WHITE)
-        score1_obj.x = self.width / 2 - score1_obj.width / 2
-        score1_obj.y = 10
+        # update objects of the side bar
+        self.score1_obj.change_text("SCORE-1:" if name1 is None else name1)
+        self.score1_obj.x = self.width / 2 - self.score1_obj.width / 2
+        self.score1_obj.y = 10
 
-        score1_v_obj = Text(str(score1).zfill(5), WHITE)
-        score1_v_obj.x = self.width / 2 - score1_v_obj.width / 2
-        score1_v_obj.y = 10 + score1_obj.height
+        self.score1_v_obj.change_text(str(score1).zfill(5))
+        self.score1_v_obj.x = self.width / 2 - self.score1_v_obj.width / 2
+        self.score1_v_obj.y = 10 + self.score1_obj.height
 
-        hscore_obj = Text("HI-SCORE:", WHITE)
-        hscore_obj.x = self.width / 2 - hscore_obj.width / 2
-        hscore_obj.y = 10 + score1_obj.height * 3
+        self.hscore_obj.x = self.width / 2 - self.hscore_obj.width / 2
+        self.hscore_obj.y = 10 + self.score1_obj.height * 3
 
-        hscore_v_obj = Text(str(highscore).zfill(5), WHITE)
-        hscore_v_obj.x = self.width / 2 - hscore_v_obj.width / 2
-        hscore_v_obj.y = 10 + score1_obj.height * 4
+        self.hscore_v_obj.change_text(str(highscore).zfill(5))
+        self.hscore_v_obj.x = self.width / 2 - self.hscore_v_obj.width / 2
+        self.hscore_v_obj.y = 10 + self.score1_obj.height * 4
 
-        score2_obj = Text("SCORE-2:" if name2 is None else name2, WHITE)
-        score2_obj.x = self.width / 2 - score2_obj.width / 2
-        score2_obj.y = 10 + score1_obj.height * 6
+        self.score2_obj.change_text("SCORE-2:" if name2 is None else name2)
+        self.score2_obj.x = self.width / 2 - self.score2_obj.width / 2
+        self.score2_obj.y = 10 + self.score1_obj.height * 6
 
-        score2_v_obj = Text(str(score2).zfill(5), WHITE)
-        score2_v_obj.x = self.width / 2 - score2_v_obj.width / 2
-        score2_v_obj.y = 10 + score1_obj.height * 7
+        self.score2_v_obj.change_text(str(score2).zfill(5))
+        self.score2_v_obj.x = self.width / 2 - self.score2_v_obj.width / 2
+        self.score2_v_obj.y = 10 + self.score1_obj.height * 7
 
-        life_obj = Text("LIFE:", WHITE)
-        life_obj.x = self.width / 2 - life_obj.width / 2
-        life_obj.y = self.height - life_obj.height * 2 - 20
+        self.life_obj.x = self.width / 2 - self.life_obj.width / 2
+        self.life_obj.y = self.height - self.life_obj.height * 2 - 20
 
-        life_v_obj = Image(f"life{life}")
-        life_v_obj.x = self.width / 2 - life_v_obj.width / 2
-        life_v_obj.y = self.height - life_v_obj.height - 20
+        self.life_v_obj = Image(f"life{life}")
+        self.life_v_obj.x = self.width / 2 - self.life_v_obj.width / 2
+        self.life_v_obj.y = self.height - self.life_v_obj.height - 20
 
         # blit objects
-        self.image.blit(score1_obj.image, (score1_obj.x, score1_obj.y))
-        self.image.blit(score1_v_obj.image, (score1_v_obj.x, score1_v_obj.y))
-        self.image.blit(hscore_obj.image, (hscore_obj.x, hscore_obj.y))
-        self.image.blit(hscore_v_obj.image, (hscore_v_obj.x, hscore_v_obj.y))
-        self.image.blit(score2_obj.image, (score2_obj.x, score2_obj.y))
-        self.image.blit(score2_v_obj.image, (score2_v_obj.x, score2_v_obj.y))
-        self.image.blit(life_obj.image, (life_obj.x, life_obj.y))
-        self.image.blit(life_v_obj.image, (life_v_obj.x, life_v_obj.y))
+        for obj in (
+            self.score1_obj,
+            self.score1_v_obj,
+            self.hscore_obj,
+            self.hscore_v_obj,
+            self.score2_obj,
+            self.score2_v_obj,
+            self.life_obj,
+            self.life_v_obj,
+        ):
+            self.image.blit(obj.image, (obj.x, obj.y))
 
 
 class BossHealthBar:
@@ -122,8 +290,26 @@ class BossHealthBar:
         self.image = pygame.Surface((self.width, self.height))
         self.x, self.y = 10, 0
 
+        # last life drawn, the health bar is only redrawn when it changes
+        self.life = None
+        self.visible = False
+        self.changed = True
+
     def update(self, boss) -> None:
-        """update the boss health bar"""
+        """update the boss health bar, nothing to do if the boss isn't alive"""
+        self.visible = boss.alive if isinstance(boss, Boss) else boss["alive"]
+        if not self.visible:
+            return
+
+        # set the y position of the health bar depending on the boss
+        self.y = (boss.y if isinstance(boss, Boss) else boss["y"]) - self.height - 10
+
+        life = boss.life if isinstance(boss, Boss) else boss["life"]
+        self.changed = life != self.life
+        if not self.changed:
+            return
+        self.life = life
+
         self.image.fill(WHITE)
         pygame.draw.line(
             self.image,
@@ -136,17 +322,82 @@ class BossHealthBar:
             self.image,
             PURPLE,
             (3, self.height / 2 - 1),
-            (
-                (self.width - 3)
-                / 10
-                * (boss.life if isinstance(boss, Boss) else boss["life"])
-                - 1,
-                self.height / 2 - 1,
-            ),
+            ((self.width - 3) / 10 * life - 1, self.height / 2 - 1),
             24,
         )
-        # set the y position of the health bar depending on the boss
-        self.y = (boss.y if isinstance(boss, Boss) else boss["y"]) - self.height - 10
+
+
+class TextCache:
+    def __init__(self, size: int) -> None:
+        """initialize the fonts cache and the rendered texts LRU cache"""
+        self.fonts = {}  # type: dict[tuple, pygame.font.Font]
+        self.surfaces = OrderedDict()  # type: OrderedDict[tuple, pygame.Surface]
+        self.size = size
+        # lookup counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_jobs(self, font_path: str, font_size: int) -> list:
+        """return the job reading a font file, the font is opened from memory"""
+
+        def add(data: bytes) -> None:
+            font = pygame.font.Font(io.BytesIO(data), font_size)
+            self.fonts[(font_path, font_size)] = font
+
+        return [(resource_read, font_path, add)]
+
+    def get_font(self, font_path: str, font_size: int) -> pygame.font.Font:
+        """return the shared font, open it if needed"""
+        key = (font_path, font_size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(
+                resource_open(font_path), font_size
+            )
+        return font
+
+    def render(
+        self, font_path: str, font_size: int, text: str, color: tuple
+    ) -> pygame.Surface:
+        """return the rendered text, render it only if it isn't cached"""
+        alpha = color[3] if len(color) == 4 else None
+        key = (font_path, font_size, text, tuple(color[:3]), alpha)
+        image = self.surfaces.get(key)
+        if image is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return image
+
+        self.misses += 1
+        image = self.get_font(font_path, font_size).render(text, True, color)
+        if alpha is not None:
+            image.set_alpha(alpha)
+        self.surfaces[key] = image
+        self.resize(self.size)
+        return image
+
+    def resize(self, size: int) -> None:
+        """change the maximum number of cached texts, evict the oldest ones"""
+        self.size = size
+        while len(self.surfaces) > self.size:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """return the cache size and the lookup counters"""
+        return {
+            "size": self.size,
+            "cached": len(self.surfaces),
+            "fonts": len(self.fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# rendered texts are shared by the whole process, never draw on them
+text_cache = TextCache(TEXT_CACHE_SIZE)
 
 
 class Text:
@@ -154,7 +405,8 @@ class Text:
         """initialize the text"""
         self.text = text
         self.color = color
-        self.font = pygame.font.Font(resource_path("src/assets/fonts/retro.ttf"), 30)
+        self.font_path = FONT_PATH
+        self.font_size = FONT_SIZE
 
         self.image = self.render()
         self.width, self.height = self.image.get_size()
@@ -162,22 +414,87 @@ class Text:
 
     def change_text(self, text: str) -> None:
         """change the text of the text object"""
+        if text == self.text:
+            return
         self.text = text
         self.image = self.render()
         self.width, self.height = self.image.get_size()
 
     def change_color(self, color: tuple) -> None:
         """change the color of the text object"""
+        if color == self.color:
+            return
         self.color = color
         self.image = self.render()
 
     def render(self) -> pygame.Surface:
         """render the text object"""
-        image = self.font.render(self.text, True, self.color)
-        if len(self.color) == 4:
-            image.set_alpha(self.color[3])
+        return text_cache.render(self.font_path, self.font_size, self.text, self.color)
+
+
+class ImageBank:
+    def __init__(self) -> None:
+        """initialize the image bank, every image is loaded once and shared by name"""
+        self.images = {}  # type: dict[str, pygame.Surface]
+        # lookup counters, a miss means the image was read from the disk
+        self.hits = 0
+        self.misses = 0
+
+    def get_jobs(self) -> list:
+        """return the jobs loading every image of the assets, the images are
+        converted when they are added, which needs a display mode"""
+        jobs = []
+        # the images packed by tools/pack_atlas.py are cut from the atlas of
+        # the executable, during development the edited images are loaded
+        # from their own file, even if the atlas is older
+        index = {}
+        if getattr(sys, "frozen", False) and resource_exists(
+            "src/assets/atlas/atlas.json"
+        ):
+            index = json.load(resource_open("src/assets/atlas/atlas.json"))
+            atlas_path = "src/assets/atlas/atlas.png"
+            jobs.append((load_image, atlas_path, partial(self.add_atlas, index)))
+
+        # images missing from the atlas are loaded one by one
+        for file_name in resource_listdir("src/assets/images"):
+            image_name, extension = os.path.splitext(file_name)
+            if extension == ".png" and image_name not in index:
+                image_path = f"src/assets/images/{file_name}"
+                jobs.append((load_image, image_path, partial(self.add, image_name)))
+        return jobs
+
+    def add(self, image_name: str, image: pygame.Surface) -> None:
+        """convert and add a loaded image"""
+        self.images[image_name] = image.convert_alpha()
+
+    def add_atlas(self, index: dict, atlas: pygame.Surface) -> None:
+        """convert the atlas and cut its images"""
+        atlas = atlas.convert_alpha()
+        for image_name, rect in index.items():
+            self.images[image_name] = atlas.subsurface(rect)
+
+    def read(self, image_name: str) -> pygame.Surface:
+        """read an image from the disk"""
+        return load_image(f"src/assets/images/{image_name}.png").convert_alpha()
+
+    def get(self, image_name: str) -> pygame.Surface:
+        """return the shared image, read it from the disk if it isn't loaded"""
+        image = self.images.get(image_name)
+        if image is None:
+            self.misses += 1
+            image = self.images[image_name] = self.read(image_name)
+        else:
+            self.hits += 1
         return image
 
+    def stats(self) -> dict:
+        """return the lookup counters"""
+        return {"loaded": len(self.images), "hits": self.hits, "misses": self.misses}
+
+
+# images are shared by the whole process, never draw on them
+image_bank = ImageBank()
+
 
 class Image:
     def __init__(self, image_name: str) -> None:
@@ -186,32 +503,105 @@ class Image:
         self.width, self.height = self.image.get_size()
         self.x, self.y = 0, 0
 
-    def find_image(self, image_name: str) -> None:
-        """find the image"""
-        image_path = resource_path(f"src/assets/images/{image_name}.png")
-        return pygame.image.load(image_path).convert_alpha()
+    def find_image(self, image_name: str) -> pygame.Surface:
+        """find the image in the image bank"""
+        return image_bank.get(image_name)
 
 
 class Sound:
-    def __init__(self) -> None:
-        """initialize the sound"""
+    @staticmethod
+    def pre_init(options: dict) -> None:
+        """set the mixer frequency and buffer size before pygame is initialized,
+        a smaller buffer plays the sounds sooner but needs a faster machine"""
+        pygame.mixer.pre_init(
+            frequency=options["audio_frequency"], buffer=options["audio_buffer"]
+        )
+
+    def __init__(self, buffer: int) -> None:
+        """initialize the sound, buffer is the size given to pre_init"""
         self.mixer = pygame.mixer
+        self.buffer = buffer
         self.mixer.music.set_volume(1)
 
+        # effects are decoded once and shared by name
+        self.sounds = {}  # type: dict[str, pygame.mixer.Sound]
+        # sounds not played because too many voices were playing
+        self.dropped = 0
+
         self.play_soundtrack()
 
+    def get_jobs(self) -> list:
+        """return the jobs decoding every sound effect of the assets"""
+        sounds = set()
+        for file_name in resource_listdir("src/assets/sounds"):
+            sound, extension = os.path.splitext(file_name)
+            if extension in (".wav", ".ogg") and sound != "soundtrack":
+                sounds.add(sound)
+        return [
+            (load_sound, self.find_path(sound), partial(self.add, sound))
+            for sound in sorted(sounds)
+        ]
+
+    def add(self, sound: str, effect: pygame.mixer.Sound) -> None:
+        """add a decoded sound effect"""
+        self.sounds[sound] = effect
+
+    def find_path(self, sound: str) -> str:
+        """return the path of a sound, compressed if there is an ogg file"""
+        sound_path = f"src/assets/sounds/{sound}.ogg"
+        if resource_exists(sound_path):
+            return sound_path
+        return f"src/assets/sounds/{sound}.wav"
+
+    def read(self, sound: str) -> pygame.mixer.Sound:
+        """decode a sound effect from the disk, in the format of the mixer"""
+        return load_sound(self.find_path(sound))
+
+    def get(self, sound: str) -> pygame.mixer.Sound:
+        """return the decoded sound effect, decode it if it isn't loaded"""
+        effect = self.sounds.get(sound)
+        if effect is None:
+            effect = self.sounds[sound] = self.read(sound)
+        return effect
+
     def play_soundtrack(self) -> None:
-        """play the soundtrack"""
-        sound_path = resource_path("src/assets/sounds/soundtrack.wav")
-        self.mixer.music.load(sound_path)
+        """play the soundtrack, decoded while it plays by the music stream"""
+        sound_path = self.find_path("soundtrack")
+        # the music stream keeps reading its file object
+        self.soundtrack = resource_open(sound_path)
+        self.mixer.music.load(self.soundtrack, sound_path)
         self.mixer.music.play(-1)
 
     def play(self, sound: str) -> None:
-        """play a sound"""
-        sound_path = resource_path(f"src/assets/sounds/{sound}.wav")
+        """play a sound, unless it already plays on enough voices or there
+        is no free channel"""
+        effect = self.get(sound)
+        if effect.get_num_channels() >= SOUND_VOICES:
+            self.dropped += 1
+            return
         channel = self.mixer.find_channel()
+        if channel is None:
+            self.dropped += 1
+            return
         channel.set_volume(0.2)
-        channel.play(self.mixer.Sound(sound_path))
+        channel.play(effect)
+
+    def latency(self) -> float:
+        """return the output latency of the mixer buffer, in milliseconds"""
+        frequency = self.mixer.get_init()[0]
+        return self.buffer / frequency * 1000
+
+    def stats(self) -> dict:
+        """return the mixer format, its latency and the dropped sounds"""
+        frequency, size, channels = self.mixer.get_init()
+        return {
+            "frequency": frequency,
+            "size": size,
+            "channels": channels,
+            "buffer": self.buffer,
+            "latency": round(self.latency(), 1),
+            "dropped": self.dropped,
+        }
 
 
 class Notification:
@@ -89,7 +89,7 @@ class Server:
                     gameId = self.idCount
                     self.idCount += 1
 
-                    self.games[gameId] = MultiEngine()
+                    self.games[gameId] = MultiEngine(effects=False)
                 else:
                     playerId = 1
                     # join an existing game
@@ -0,0 +1,71 @@
+import numpy as np
+from src.variables import PARTICLES_CAPACITY, PARTICLES_PER_BURST
+
+
+class Particles:
+    def __init__(self, capacity=PARTICLES_CAPACITY) -> None:
+        """initialize the particles, stored in arrays of a fixed capacity"""
+        self.capacity = capacity
+        self.position = np.zeros((capacity, 2), np.float32)
+        self.velocity = np.zeros((capacity, 2), np.float32)
+        self.age = np.zeros(capacity, np.float32)
+        self.lifetime = np.ones(capacity, np.float32)
+        self.color = np.zeros((capacity, 3), np.float32)
+        # particles alive are the first ones of the arrays
+        self.count = 0
+        self.random = np.random.default_rng()
+
+    def burst(
+        self,
+        x: float,
+        y: float,
+        count=PARTICLES_PER_BURST,
+        speed=0.25,
+        lifetime=500,
+        color=(255, 160, 40),
+    ) -> None:
+        """spawn a burst of particles from a point, speed in pixels per ms and
+        lifetime in ms, particles over the capacity are dropped"""
+        count = min(count, self.capacity - self.count)
+        new = slice(self.count, self.count + count)
+        angle = self.random.uniform(0, 2 * np.pi, count)
+        magnitude = self.random.uniform(0, speed, count)
+
+        self.position[new] = (x, y)
+        self.velocity[new, 0] = np.cos(angle) * magnitude
+        self.velocity[new, 1] = np.sin(angle) * magnitude
+        self.age[new] = 0
+        self.lifetime[new] = self.random.uniform(lifetime / 2, lifetime, count)
+        # vary the brightness of the color
+        self.color[new] = np.outer(self.random.uniform(0.6, 1, count), color)
+        self.count += count
+
+    def update(self, dt: int) -> None:
+        """move and age the particles, remove the dead ones"""
+        alive = slice(0, self.count)
+        self.position[alive] += self.velocity[alive] * dt
+        self.age[alive] += dt
+
+        living = self.age[alive] < self.lifetime[alive]
+        if not living.all():
+            count = int(living.sum())
+            for array in (
+                self.position,
+                self.velocity,
+                self.age,
+                self.lifetime,
+                self.color,
+            ):
+                array[:count] = array[alive][living]
+            self.count = count
+
+    def get_data(self) -> tuple:
+        """return the positions and colors of the particles alive, copies
+        which can be drawn while the particles are updated"""
+        return self.position[: self.count].copy(), self.get_colors()
+
+    def get_colors(self) -> np.ndarray:
+        """return the colors of the particles alive, fading with their age"""
+        alive = slice(0, self.count)
+        fade = 1 - self.age[alive] / self.lifetime[alive]
+        return (self.color[alive] * fade[:, None]).astype(np.uint32)
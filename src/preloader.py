@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from src.variables import PRELOAD_WORKERS
+
+
+class Preloader:
+    def __init__(self, jobs: list, workers=PRELOAD_WORKERS) -> None:
+        """initialize the preloader of (decode, path, add) jobs, the files are
+        decoded by a pool of threads, the results are added on the main thread"""
+        self.jobs = jobs
+        self.workers = workers
+        self.executor = None
+        self.pending = []
+        self.added = 0
+
+    def start(self) -> None:
+        """start decoding every file"""
+        self.executor = ThreadPoolExecutor(self.workers)
+        self.pending = [
+            (self.executor.submit(decode, path), add) for decode, path, add in self.jobs
+        ]
+
+    def update(self) -> None:
+        """add the decoded files"""
+        pending = []
+        for future, add in self.pending:
+            if future.done():
+                add(future.result())
+                self.added += 1
+            else:
+                pending.append((future, add))
+        self.pending = pending
+        if not self.pending and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def wait(self, timeout: float) -> None:
+        """wait until a file is decoded, at most timeout seconds"""
+        wait([future for future, add in self.pending], timeout, FIRST_COMPLETED)
+
+    @property
+    def progress(self) -> float:
+        """return the part of the jobs done, from 0 to 1"""
+        return self.added / len(self.jobs) if self.jobs else 1
+
+    @property
+    def done(self) -> bool:
+        """return True if every file was added"""
+        return not self.pending
@@ -0,0 +1,115 @@
+import os
+import struct
+import threading
+import zlib
+import pygame
+from queue import SimpleQueue, Empty
+from src.variables import RECORDER_CAPACITY
+
+
+def write_png(path: str, size: tuple, rgb: bytes) -> None:
+    """write rgb pixels as a png file, zlib lets the other threads run while
+    it compresses, unlike pygame.image.save"""
+    width, height = size
+    stride = width * 3
+    # each row starts with its filter type, 0 means no filter
+    rows = b"".join(b"\x00" + rgb[y * stride : (y + 1) * stride] for y in range(height))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", zlib.crc32(kind + data))
+        )
+
+    with open(path, "wb") as png_file:
+        png_file.write(b"\x89PNG\r\n\x1a\n")
+        png_file.write(
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        )
+        png_file.write(chunk(b"IDAT", zlib.compress(rows, 1)))
+        png_file.write(chunk(b"IEND", b""))
+
+
+class Recorder:
+    def __init__(self, size: tuple, directory: str, format="png") -> None:
+        """initialize the recorder, frames are copied into a ring of buffers
+        allocated once, a worker writes them as png files or a raw rgb stream"""
+        self.size = size
+        self.directory = directory
+        self.format = format
+        self.buffers = [pygame.Surface(size) for i in range(RECORDER_CAPACITY)]
+        # indexes of the buffers free to copy a frame to, and of the copied ones
+        self.free = SimpleQueue()
+        for i in range(RECORDER_CAPACITY):
+            self.free.put(i)
+        self.frames = SimpleQueue()
+
+        self.recorded = 0
+        self.dropped = 0
+        self.thread = None
+
+    def start(self) -> None:
+        """create the recording directory and start the worker"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """write the frames left and stop the worker"""
+        if self.thread is not None:
+            self.frames.put(None)
+            self.thread.join()
+            self.thread = None
+            self.write_info()
+
+    def capture(self, copy) -> None:
+        """copy a frame with copy(buffer), drop it if every buffer is busy"""
+        try:
+            i = self.free.get_nowait()
+        except Empty:
+            self.dropped += 1
+            return
+        copy(self.buffers[i])
+        self.frames.put((i, self.recorded + self.dropped))
+        self.recorded += 1
+
+    def run(self) -> None:
+        """write the copied frames until the recorder is stopped"""
+        stream = None
+        if self.format == "raw":
+            width, height = self.size
+            path = os.path.join(self.directory, f"frames_{width}x{height}.rgb")
+            stream = open(path, "wb")
+
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            i, number = frame
+            rgb = pygame.image.tobytes(self.buffers[i], "RGB")
+            # the buffer is free as soon as its pixels are read
+            self.free.put(i)
+            if stream is None:
+                path = os.path.join(self.directory, f"{number:06d}.png")
+                write_png(path, self.size, rgb)
+            else:
+                stream.write(rgb)
+
+        if stream is not None:
+            stream.close()
+
+    def write_info(self) -> None:
+        """write the frames count of the recording next to it"""
+        with open(os.path.join(self.directory, "recording.txt"), "w") as info_file:
+            info_file.write(str(self.stats()))
+
+    def stats(self) -> dict:
+        """return the recorded and dropped frames counts"""
+        return {
+            "format": self.format,
+            "size": self.size,
+            "recorded": self.recorded,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,401 @@
+import weakref
+import numpy as np
+import pygame
+from collections import deque
+from src.objects import image_bank
+from src.variables import *
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    Renderer = None
+
+
+class RenderQueue:
+    def __init__(self) -> None:
+        """initialize the render queue, (image, position) pairs sorted by layer"""
+        self.layers = {layer: [] for layer in RENDER_LAYERS}
+        # images drawn by their object, mapped to whether they changed
+        self.changed = {}  # type: dict[pygame.Surface, bool]
+        # particles (positions, colors) are drawn over the background layer
+        self.particles = []  # type: list[tuple]
+
+    def clear(self) -> None:
+        """empty the layers for the next frame"""
+        for blits in self.layers.values():
+            blits.clear()
+        self.changed.clear()
+        self.particles.clear()
+
+    def add_sprites_data(self, layer: str, sprites_data) -> None:
+        """add sprites data of a snapshot or received from the server"""
+        get = image_bank.get
+        self.layers[layer].extend(
+            [(get(data["image_name"]), (data["x"], data["y"])) for data in sprites_data]
+        )
+
+    def add_objects(self, layer: str, objects) -> None:
+        """add objects owning their image, like texts or the side bar"""
+        blits = self.layers[layer]
+        for obj in objects:
+            if obj is None:
+                continue
+            blits.append((obj.image, (obj.x, obj.y)))
+            # objects redrawing their image tell if it changed
+            if hasattr(obj, "changed"):
+                self.changed[obj.image] = obj.changed
+
+    def add_particles(self, particles) -> None:
+        """add the particles of an engine"""
+        self.particles.append(particles.get_data())
+
+    def add_particles_data(self, particles_data: tuple) -> None:
+        """add particles data of a snapshot"""
+        self.particles.append(particles_data)
+
+    def draw_particles(self, target: pygame.Surface, scale=1) -> pygame.Rect:
+        """draw the particles on the target, return the rect they cover"""
+        rects = [draw_particles(target, p, scale) for p in self.particles]
+        rects = [rect for rect in rects if rect is not None]
+        return rects[0].unionall(rects[1:]) if rects else None
+
+    def submit(self, target: pygame.Surface) -> None:
+        """blit every layer on the target, one call per layer"""
+        for layer, blits in self.layers.items():
+            target.blits(blits, doreturn=False)
+            if layer == "background":
+                self.draw_particles(target)
+
+
+def draw_particles(surface: pygame.Surface, particles_data, scale=1) -> pygame.Rect:
+    """write the particles as pixels of a 32 bits surface, in one numpy
+    assignment, return the rect they cover or None if there are none, the
+    particles are clipped to the game area"""
+    position, colors = particles_data
+    if not len(position):
+        return None
+    width, height = surface.get_size()
+    width = min(width, int(GAME_WIDTH * scale))
+    position = (position * scale).astype(np.intp)
+    x, y = position[:, 0], position[:, 1]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    if not inside.any():
+        return None
+    x, y = x[inside], y[inside]
+
+    colors = colors[inside]
+    rshift, gshift, bshift, _ = surface.get_shifts()
+    # opaque pixels if the surface has an alpha channel
+    alpha = surface.get_masks()[3]
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[x, y] = (
+        (colors[:, 0] << rshift)
+        | (colors[:, 1] << gshift)
+        | (colors[:, 2] << bshift)
+        | alpha
+    )
+    # unlock the surface before it is blitted
+    del pixels
+
+    left, top = int(x.min()), int(y.min())
+    return pygame.Rect(left, top, int(x.max()) - left + 1, int(y.max()) - top + 1)
+
+
+class Presenter:
+    def __init__(self, size: tuple, scaled=True) -> None:
+        """initialize the window, let SDL scale it to its real size if possible"""
+        self.size = size
+        self.scaled = False
+        if scaled:
+            try:
+                self.window = pygame.display.set_mode(
+                    self.size, pygame.RESIZABLE | pygame.SCALED
+                )
+                self.scaled = True
+            except pygame.error:
+                pass
+        if not self.scaled:
+            self.window = pygame.display.set_mode(self.size, pygame.RESIZABLE)
+
+    # the game is composed on the background image before being presented
+    compose = True
+
+    def draw(self, background, queue: RenderQueue) -> None:
+        """draw the background and the render queue, and present it"""
+        background.draw()
+        queue.submit(background.image)
+        self.present(background.image)
+
+    def present(self, image: pygame.Surface) -> None:
+        """copy the game image to the window, scale it only if resized"""
+        size = self.window.get_size()
+        if size == image.get_size():
+            self.window.blit(image, (0, 0))
+        else:
+            # scale straight into the window, no new surface each frame
+            pygame.transform.scale(image, size, self.window)
+
+    def update_display(self) -> None:
+        """push the presented frame to the display"""
+        pygame.display.update()
+
+    def capture(self, target: pygame.Surface) -> None:
+        """copy the frame of the window to the target, at the target size"""
+        size = target.get_size()
+        if self.window.get_size() == size:
+            target.blit(self.window, (0, 0))
+        else:
+            pygame.transform.scale(self.window, size, target)
+
+
+class TextureRenderer(Presenter):
+    # the background layers are drawn as textures, not on the background image
+    compose = False
+
+    def __init__(self, size: tuple) -> None:
+        """initialize the window and draw with the SDL renderer of the scaled window,
+        SDL picks its software renderer if there is no GPU"""
+        super().__init__(size, scaled=True)
+        if Renderer is None or not self.scaled:
+            raise pygame.error("SDL renderer unavailable")
+        self.renderer = Renderer.from_window(Window.from_display_module())
+        self.renderer.logical_size = size
+        # each image is uploaded once, its texture goes with it
+        self.textures = weakref.WeakKeyDictionary()
+        # particles are drawn on a transparent overlay, only the rect they
+        # cover (and covered last frame) is uploaded
+        self.overlay = pygame.Surface(size, pygame.SRCALPHA)
+        self.overlay_texture = None
+        self.overlay_rect = None
+
+    def get_texture(self, image: pygame.Surface, changed=None) -> Texture:
+        """return the texture of the image, upload it again if the image changed"""
+        texture = self.textures.get(image)
+        if texture is None:
+            texture = self.textures[image] = Texture.from_surface(self.renderer, image)
+        elif changed:
+            texture.update(image)
+        return texture
+
+    def draw(self, background, queue: RenderQueue) -> None:
+        """draw the background layers and the render queue"""
+        self.renderer.draw_color = (*BLACK, 255)
+        self.renderer.clear()
+
+        for image, speed, offset in background.layers:
+            texture = self.get_texture(image)
+            y = int(offset)
+            texture.draw(dstrect=(0, y))
+            texture.draw(dstrect=(0, y - background.height))
+        if background.playing:
+            self.renderer.draw_color = (*RED, 255)
+            self.renderer.fill_rect(
+                (20, background.gameh - 21, background.gamew - 39, 3)
+            )
+
+        get_texture = self.get_texture
+        for layer, blits in queue.layers.items():
+            for image, position in blits:
+                get_texture(image, queue.changed.get(image)).draw(dstrect=position)
+            if layer == "background":
+                self.draw_particles(queue)
+
+    def draw_particles(self, queue: RenderQueue) -> None:
+        """draw the particles of the queue with the overlay texture"""
+        if self.overlay_rect is not None:
+            self.overlay.fill((0, 0, 0, 0), self.overlay_rect)
+        rect = queue.draw_particles(self.overlay)
+        if rect is None and self.overlay_rect is None:
+            return
+        # upload the new particles and the erased old ones
+        areas = [r for r in (rect, self.overlay_rect) if r is not None]
+        area = areas[0].unionall(areas[1:])
+        self.overlay_rect = rect
+        if self.overlay_texture is None:
+            self.overlay_texture = Texture.from_surface(self.renderer, self.overlay)
+        else:
+            self.overlay_texture.update(self.overlay.subsurface(area), area)
+        if rect is not None:
+            self.overlay_texture.draw(srcrect=rect, dstrect=rect)
+
+    def present(self, image: pygame.Surface) -> None:
+        """draw an image over the whole window"""
+        self.get_texture(image, True).draw(dstrect=(0, 0))
+
+    def update_display(self) -> None:
+        """present the frame drawn by the renderer"""
+        self.renderer.present()
+
+    def capture(self, target: pygame.Surface) -> None:
+        """read the frame drawn by the renderer into the target"""
+        self.renderer.to_surface(target)
+
+
+class DirtyRenderer:
+    def __init__(self) -> None:
+        """initialize the dirty rectangles renderer"""
+        self.active = False
+        # rects drawn last frame, erased with the background next frame
+        self.drawn = []  # type: list[pygame.Rect]
+        # rects to push to the display, None means the whole screen
+        self.rects = None  # type: list[pygame.Rect]
+
+    def reset(self) -> None:
+        """forget what is on the screen, the next frame is fully drawn"""
+        self.active = False
+        self.drawn = []
+        self.rects = None
+
+    def draw(self, screen: pygame.Surface, background, queue: RenderQueue, retained=()):
+        """draw the render queue over the background, only the stars that
+        moved are redrawn, retained images like the side bar never move, they
+        are only drawn when they changed and are never erased"""
+        image = background.image
+        if self.active:
+            # erase the previous sprites and the moved stars with the background
+            erased = self.drawn + background.draw_moved_stars()
+            screen.blits([(image, rect, rect) for rect in erased], False)
+            self.rects = erased
+        else:
+            background.draw()
+            screen.blit(image, (0, 0))
+            self.rects = None
+            erased = []
+
+        self.drawn = []
+        for layer, blits in queue.layers.items():
+            if self.active and retained:
+                # a retained image is drawn again if anything erased part of it
+                blits = [
+                    blit
+                    for blit in blits
+                    if blit[0] not in retained
+                    or queue.changed[blit[0]]
+                    or blit[0].get_rect(topleft=blit[1]).collidelist(erased) != -1
+                ]
+            rects = screen.blits(blits)
+            if self.rects is not None:
+                self.rects.extend(rects)
+            if retained:
+                rects = [r for r, blit in zip(rects, blits) if blit[0] not in retained]
+            if layer == "background":
+                rect = queue.draw_particles(screen)
+                if rect is not None:
+                    rects.append(rect)
+                    if self.rects is not None:
+                        self.rects.append(rect)
+            self.drawn.extend(rects)
+
+        self.active = True
+
+    def update_display(self) -> None:
+        """push the dirty rects, or the whole screen, to the display"""
+        if self.rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(self.rects)
+
+
+class DynamicResolution:
+    def __init__(self, size: tuple, budget=1000 / 60) -> None:
+        """initialize the dynamic resolution, the game area is drawn at a lower
+        resolution while the frames take longer than the budget (ms), the
+        side bar stays at full resolution"""
+        self.size = size
+        self.budget = budget
+        self.level = 0
+        # work time of the last frames, without the clock delay
+        self.times = deque(maxlen=30)
+        # game area frame and images for each scale, images are scaled once
+        self.frames = {}  # type: dict[float, pygame.Surface]
+        self.images = weakref.WeakKeyDictionary()
+        # full resolution image, the game area frame is scaled up on its left
+        self.image = None
+        self.game_image = None
+
+    @property
+    def scale(self) -> float:
+        """return the current scale of the resolution"""
+        return RESOLUTION_SCALES[self.level]
+
+    def record(self, frame_time: int) -> None:
+        """record the time of a frame, change the level if needed"""
+        self.times.append(frame_time)
+        if len(self.times) < self.times.maxlen:
+            return
+        average = sum(self.times) / len(self.times)
+        if average > self.budget and self.level < len(RESOLUTION_SCALES) - 1:
+            self.level += 1
+            self.times.clear()
+        elif average < self.budget * 0.6 and self.level > 0:
+            self.level -= 1
+            self.times.clear()
+
+    def get_image(self, image: pygame.Surface) -> pygame.Surface:
+        """return the image at the current scale"""
+        scaled = self.images.get(image)
+        if scaled is None:
+            scaled = self.images[image] = {}
+        if self.scale not in scaled:
+            width, height = image.get_size()
+            size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+            scaled[self.scale] = pygame.transform.scale(image, size)
+            # keep the fast colorkey of the star layers
+            if image.get_colorkey() is not None:
+                scaled[self.scale].set_colorkey(image.get_colorkey(), pygame.RLEACCEL)
+        return scaled[self.scale]
+
+    def draw(self, background, queue: RenderQueue) -> pygame.Surface:
+        """draw the game area at the current scale and the side bar at full
+        resolution, return the frame"""
+        # forget the scaled images of the objects that redrew their image
+        for image, changed in queue.changed.items():
+            if changed:
+                self.images.pop(image, None)
+
+        scale = self.scale
+        if scale == 1:
+            background.draw()
+            queue.submit(background.image)
+            return background.image
+
+        frame = self.frames.get(scale)
+        if frame is None:
+            size = (int(GAME_WIDTH * scale), int(self.size[1] * scale))
+            frame = self.frames[scale] = pygame.Surface(size).convert()
+        if self.image is None:
+            self.image = pygame.Surface(self.size).convert()
+            self.game_image = self.image.subsurface((0, 0, GAME_WIDTH, self.size[1]))
+
+        for image, speed, offset in background.layers:
+            layer = self.get_image(image)
+            y = int(offset * scale)
+            frame.blit(layer, (0, y))
+            frame.blit(layer, (0, y - layer.get_height()))
+        if background.playing:
+            pygame.draw.line(
+                frame,
+                RED,
+                (20 * scale, (background.gameh - 20) * scale),
+                ((background.gamew - 20) * scale, (background.gameh - 20) * scale),
+                max(1, int(3 * scale)),
+            )
+
+        get_image = self.get_image
+        side_blits = []
+        for layer, blits in queue.layers.items():
+            frame.blits(
+                [
+                    (get_image(image), (x * scale, y * scale))
+                    for image, (x, y) in blits
+                    if x < GAME_WIDTH
+                ],
+                False,
+            )
+            side_blits.extend(blit for blit in blits if blit[1][0] >= GAME_WIDTH)
+            if layer == "background":
+                queue.draw_particles(frame, scale)
+
+        pygame.transform.scale(frame, self.game_image.get_size(), self.game_image)
+        self.image.blits(side_blits, False)
+        return self.image
@@ -0,0 +1,25 @@
+import heapq
+from itertools import count
+
+
+class Scheduler:
+    def __init__(self) -> None:
+        """initialize the scheduler of an engine, its events run on the game
+        time given to update, on the thread updating the engine"""
+        self.time = 0  # milliseconds
+        # heap of (time, order, callback, args), order keeps the events due at
+        # the same time in the order they were scheduled
+        self.events = []  # type: list[tuple]
+        self.order = count()
+
+    def schedule(self, delay: float, callback, *args) -> None:
+        """run callback(*args) after delay seconds of game time"""
+        event = (self.time + delay * 1000, next(self.order), callback, args)
+        heapq.heappush(self.events, event)
+
+    def update(self, dt: int) -> None:
+        """advance the game time by dt milliseconds, run the events due"""
+        self.time += dt
+        while self.events and self.events[0][0] <= self.time:
+            time, order, callback, args = heapq.heappop(self.events)
+            callback(*args)
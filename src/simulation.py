@@ -0,0 +1,116 @@
+import threading
+from queue import SimpleQueue, Empty
+from time import perf_counter, sleep
+from src.variables import SIMULATION_RATE
+
+
+class TripleBuffer:
+    def __init__(self) -> None:
+        """initialize the triple buffer, the writer fills the back slot while
+        the reader draws the front slot, the middle slot is the latest one"""
+        self.slots = [None, None, None]
+        self.back, self.middle, self.front = 0, 1, 2
+        self.fresh = False
+        # only held to swap two indexes, never while writing or reading a slot
+        self.swap = threading.Lock()
+
+    def publish(self, snapshot) -> None:
+        """write a snapshot in the back slot and make it the latest one"""
+        self.slots[self.back] = snapshot
+        with self.swap:
+            self.back, self.middle = self.middle, self.back
+            self.fresh = True
+
+    def latest(self):
+        """return the latest complete snapshot"""
+        if self.fresh:
+            with self.swap:
+                self.front, self.middle = self.middle, self.front
+                self.fresh = False
+        return self.slots[self.front]
+
+
+class Simulation:
+    def __init__(self, engine, get_sounds, threaded=False) -> None:
+        """initialize the simulation of an engine, it runs on its own thread
+        if threaded, else it is updated by the game loop"""
+        self.engine = engine
+        self.get_sounds = get_sounds
+        self.threaded = threaded
+        self.running = False
+        self.thread = None
+
+        self.buffer = TripleBuffer()
+        self.buffer.publish(engine.get_snapshot())
+        # commands of the game loop and sounds of the engine
+        self.commands = SimpleQueue()
+        self.sounds = SimpleQueue()
+
+    def start(self) -> None:
+        """start the simulation thread"""
+        if self.threaded and not self.running:
+            self.running = True
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self) -> None:
+        """stop the simulation thread, wait for its last tick"""
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def run(self) -> None:
+        """update the engine at a fixed rate and publish its snapshots"""
+        period = 1 / SIMULATION_RATE
+        previous = perf_counter()
+        # the engines take whole milliseconds, keep what is left for later
+        remainder = 0
+        while self.running:
+            now = perf_counter()
+            elapsed = (now - previous) * 1000 + remainder
+            previous = now
+            dt = int(elapsed)
+            remainder = elapsed - dt
+
+            self.tick(dt)
+            sleep(max(0, period - (perf_counter() - now)))
+
+    def tick(self, dt: int) -> None:
+        """execute the commands, update the engine and publish a snapshot"""
+        while True:
+            try:
+                command, args = self.commands.get_nowait()
+            except Empty:
+                break
+            command(*args)
+
+        self.engine.update(dt)
+        for sound in self.get_sounds():
+            self.sounds.put(sound)
+        self.buffer.publish(self.engine.get_snapshot())
+
+    def step(self, dt: int) -> None:
+        """update the engine from the game loop, if it has no thread"""
+        if not self.threaded:
+            self.tick(dt)
+
+    def send(self, command, *args) -> None:
+        """execute a command on the engine, in the simulation thread if any"""
+        if self.threaded:
+            self.commands.put((command, args))
+        else:
+            command(*args)
+
+    def latest(self) -> dict:
+        """return the latest snapshot of the engine"""
+        return self.buffer.latest()
+
+    def pop_sounds(self) -> list:
+        """return the sounds played since the last call"""
+        sounds = []
+        while True:
+            try:
+                sounds.append(self.sounds.get_nowait())
+            except Empty:
+                return sounds
@@ -1,5 +1,4 @@
 import random
-from threading import Timer
 from src.variables import *
 
 
@@ -11,6 +10,19 @@ class Sprite:
         self.image_name = ""
         self.width, self.height = 0, 0
         self.x, self.y = 0, 0
+        self.active = True
+
+    def reset(self) -> None:
+        """set the attributes of a new sprite"""
+
+    def activate(self, *args) -> None:
+        """reuse a pooled sprite, reset with args"""
+        self.reset(*args)
+        self.active = True
+
+    def deactivate(self) -> None:
+        """put a sprite back in its pool"""
+        self.active = False
 
     def collide(self, other) -> bool:
         """check if two sprites collide"""
@@ -54,6 +66,10 @@ class Invader(Sprite):
     def __init__(self) -> None:
         """initialize invader"""
         super().__init__()
+        self.reset()
+
+    def reset(self) -> None:
+        """set invader attributes, above the screen"""
         self.type = random.randrange(4)
         # set sprite attributes
         self.image_name = f"invader{self.type}"
@@ -73,7 +89,7 @@ class Invader(Sprite):
 
     def die(self) -> None:
         """kill invader and make it repop"""
-        self.__init__()
+        self.reset()
 
     def move(self, dt: int) -> None:
         """move invader"""
@@ -131,6 +147,10 @@ class Laser(Sprite):
     def __init__(self, player: Player) -> None:
         """initialize laser"""
         super().__init__()
+        self.reset(player)
+
+    def reset(self, player: Player) -> None:
+        """set laser attributes, on the player"""
         self.player = player
         # set sprite attributes
         self.image_name = "laser"
@@ -159,6 +179,10 @@ class Bomb(Sprite):
     def __init__(self, boss: Boss) -> None:
         """initialize bomb"""
         super().__init__()
+        self.reset(boss)
+
+    def reset(self, boss: Boss) -> None:
+        """set bomb attributes, under the boss"""
         self.boss = boss
         # set sprite attributes
         self.image_name = "bomb"
@@ -179,13 +203,18 @@ class Explosion(Sprite):
     def __init__(self, x: int, y: int, lifetime: int) -> None:
         """initialize explosion"""
         super().__init__()
+        self.reset(x, y, lifetime)
+
+    def reset(self, x: int, y: int, lifetime: int) -> None:
+        """set explosion attributes"""
         # set sprite attributes
         self.image_name = "explode"
         self.width, self.height = 64, 64
         self.x, self.y = x, y
         # set explosion attributes
         self.over = False
-        Timer(lifetime, self.set_over).start()
+        # the engine sets the explosion over once its lifetime is elapsed
+        self.lifetime = lifetime
 
     def set_over(self) -> None:
         """set explosion to over"""
@@ -0,0 +1,29 @@
+from time import perf_counter
+
+
+class StartupReport:
+    def __init__(self, started: float) -> None:
+        """initialize the report, started is the time the imports started"""
+        self.started = started
+        self.last = started
+        self.phases = []  # type: list[tuple[str, float]]
+        self.done = False
+
+    def step(self, phase: str) -> None:
+        """record the time of a phase, since the previous one"""
+        now = perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+
+    def finish(self) -> None:
+        """record the time until the first frame"""
+        self.step("first frame")
+        self.done = True
+
+    def report(self) -> str:
+        """return the time of each phase and the total, in milliseconds"""
+        lines = [
+            f"{phase:<14}{duration * 1000:8.1f} ms" for phase, duration in self.phases
+        ]
+        lines.append(f"{'total':<14}{(self.last - self.started) * 1000:8.1f} ms")
+        return "\n".join(lines)
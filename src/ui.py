@@ -0,0 +1,111 @@
+from src.objects import Text, Image
+from src.variables import *
+
+
+def line_height() -> int:
+    """return the height of a line of text"""
+    return Text(" ", WHITE).height
+
+
+class Widget:
+    def __init__(self, bind) -> None:
+        """initialize the widget, bind is a function returning the value shown
+        by the widget, or the value itself if it never changes"""
+        self.bind = bind if callable(bind) else lambda: bind
+        self.value = None
+        self.image = None
+        self.width, self.height = 0, 0
+        self.x, self.y = 0, 0
+
+    def update(self) -> None:
+        """render the widget again only if its bound value changed, each kind
+        of widget renders its value with its own render method"""
+        value = self.bind()
+        if self.image is None or value != self.value:
+            self.value = value
+            self.render(value)
+
+    def place(self, x: float, y: float, align: str) -> None:
+        """place the widget from its left, center or right"""
+        if align == "center":
+            self.x = x - self.width / 2
+        elif align == "right":
+            self.x = x - self.width
+        else:
+            self.x = x
+        self.y = y
+
+
+class Label(Widget):
+    def __init__(self, bind, x: float, y: float, align="center") -> None:
+        """initialize the label, bind returns its (text, color)"""
+        self.text = None
+        self.anchor = (x, y, align)
+        super().__init__(bind)
+        self.update()
+
+    def render(self, value: tuple) -> None:
+        """render the text of the label"""
+        text, color = value
+        if self.text is None:
+            self.text = Text(text, color)
+        else:
+            self.text.change_text(text)
+            self.text.change_color(color)
+        self.image = self.text.image
+        self.width, self.height = self.text.width, self.text.height
+        self.place(*self.anchor)
+
+
+class Picture(Widget):
+    def __init__(self, bind, x: float, y: float, align="center") -> None:
+        """initialize the picture, bind returns its image name"""
+        self.anchor = (x, y, align)
+        super().__init__(bind)
+        self.update()
+
+    def render(self, value: str) -> None:
+        """find the image of the picture"""
+        self.image = Image(value).image
+        self.width, self.height = self.image.get_size()
+        self.place(*self.anchor)
+
+
+class Pointer(Widget):
+    def __init__(self, bind, gap=15) -> None:
+        """initialize the arrow pointer, bind returns the widget it points to"""
+        self.gap = gap
+        super().__init__(bind)
+        self.image = Image("arrow").image
+        self.width, self.height = self.image.get_size()
+        self.update()
+
+    def update(self) -> None:
+        """move the pointer only if its widget changed or moved"""
+        widget = self.bind()
+        value = (widget, widget.x, widget.y)
+        if value != self.value:
+            self.value = value
+            self.render(value)
+
+    def render(self, value: tuple) -> None:
+        """place the pointer on the left of its widget"""
+        widget, x, y = value
+        self.x, self.y = x - self.width - self.gap, y + 4
+
+
+class Layout:
+    def __init__(self, *widgets) -> None:
+        """initialize the layout, a tree of widgets and layouts"""
+        self.widgets = list(widgets)
+
+    def update(self) -> list:
+        """update the widgets, return them in drawing order"""
+        widgets = []
+        for widget in self.widgets:
+            if isinstance(widget, Layout):
+                widgets.extend(widget.update())
+            else:
+                widget.update()
+                widgets.append(widget)
+        return widgets
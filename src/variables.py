@@ -1,10 +1,23 @@
-import pygame
-
 WIDTH, HEIGHT = 1000, 750
 SIDE_WIDTH = 275
 GAME_WIDTH, GAME_HEIGHT = WIDTH - SIDE_WIDTH, HEIGHT
 N_INVADERS = 6
 N_STARS = 200
+N_STAR_LAYERS = 3
+TEXT_CACHE_SIZE = 256
+RENDER_LAYERS = ("background", "enemies", "projectiles", "players", "hud")
+RESOLUTION_SCALES = (1, 0.75, 0.5)
+IDLE_DELAY = 3
+PARTICLES_CAPACITY = 50000
+PARTICLES_PER_BURST = 150
+SIMULATION_RATE = 60
+RECORDER_CAPACITY = 30
+SOUND_VOICES = 3
+PRELOAD_WORKERS = 4
+FONT_PATH = "src/assets/fonts/retro.ttf"
+BUNDLE_PATH = "src/assets/assets.bundle"
+BUNDLE_MAGIC = b"SIBUNDLE"
+FONT_SIZE = 30
 BLACK = (0, 0, 0)
 INACTIVE_GREY = (200, 200, 200, 60)
 WHITE = (255, 255, 255)
@@ -13,11 +26,15 @@ GREEN = (30, 233, 99)
 BLUE = (30, 99, 233)
 PURPLE = (71, 91, 202)
 PORT = 1313
-CONTROLS = {
-    "enter": pygame.K_RETURN,
-    "left": pygame.K_LEFT,
-    "right": pygame.K_RIGHT,
-    "up": pygame.K_UP,
-    "down": pygame.K_DOWN,
-    "shoot": pygame.K_SPACE,
+OPTIONS = {
+    "dirty_rects": False,
+    "scaled_display": True,
+    "renderer": "surface",
+    "dynamic_resolution": False,
+    "idle_fps": 10,
+    "simulation_thread": False,
+    "record": "",
+    "audio_frequency": 44100,
+    "audio_buffer": 512,
+    "startup_report": False,
 }
@@ -0,0 +1,46 @@
+import os
+import sys
+import argparse
+import contextlib
+
+# run from the root of the repository
+sys.path.insert(0, os.path.abspath("."))
+
+# import pygame silently
+with contextlib.redirect_stdout(None):
+    import pygame
+
+from src.config import Config
+from src.objects import Sound
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="print the mixer format and latency of the audio options"
+    )
+    parser.add_argument("--frequency", type=int, help="replace the configured one")
+    parser.add_argument("--buffer", type=int, help="replace the configured one")
+    args = parser.parse_args()
+
+    config = Config()
+    config.get()
+    options = config.options
+    if args.frequency:
+        options["audio_frequency"] = args.frequency
+    if args.buffer:
+        options["audio_buffer"] = args.buffer
+
+    Sound.pre_init(options)
+    pygame.mixer.init()
+    if pygame.mixer.get_init() is None:
+        print("no audio device")
+        return 1
+
+    sound = Sound(options["audio_buffer"])
+    for name, value in sound.stats().items():
+        print(f"{name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
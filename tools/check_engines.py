@@ -0,0 +1,33 @@
+import os
+import sys
+
+# run from the root of the repository
+sys.path.insert(0, os.path.abspath("."))
+
+
+def main() -> int:
+    """check that the engines and the server run without pygame"""
+    import src.engines
+    import src.online
+
+    if "pygame" in sys.modules:
+        print("importing the engines imported pygame")
+        return 1
+
+    # play a few seconds of a game, as a server would
+    engine = src.engines.MultiEngine(effects=False)
+    engine.ready = True
+    for i in range(300):
+        engine.shoot_laser(i % 2)
+        engine.update(16)
+    engine.get_data(0)
+
+    if "pygame" in sys.modules:
+        print("running the engines imported pygame")
+        return 1
+    print("the engines run without pygame")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
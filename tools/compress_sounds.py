@@ -0,0 +1,57 @@
+import os
+import sys
+
+# soundfile is only needed to compress the sounds, not to play them
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+# run from the root of the repository
+SOUNDS_DIR = "src/assets/sounds"
+QUALITY = 0.4
+
+
+def compress(wav_path: str, ogg_path: str) -> None:
+    """encode a wav file as ogg vorbis"""
+    data, samplerate = soundfile.read(wav_path)
+    soundfile.write(
+        ogg_path,
+        data,
+        samplerate,
+        format="OGG",
+        subtype="VORBIS",
+        compression_level=1 - QUALITY,
+    )
+
+
+def main() -> int:
+    if soundfile is None:
+        print("soundfile is needed to compress the sounds: pip install soundfile")
+        return 1
+
+    wav_size, ogg_size = 0, 0
+    for file_name in sorted(os.listdir(SOUNDS_DIR)):
+        sound, extension = os.path.splitext(file_name)
+        if extension != ".wav":
+            continue
+        wav_path = os.path.join(SOUNDS_DIR, file_name)
+        ogg_path = os.path.join(SOUNDS_DIR, sound + ".ogg")
+        compress(wav_path, ogg_path)
+        # the headers of vorbis outweigh the gain on the shortest sounds
+        if os.path.getsize(ogg_path) >= os.path.getsize(wav_path):
+            os.remove(ogg_path)
+            print(f"{sound}: kept as wav")
+            continue
+        wav_size += os.path.getsize(wav_path)
+        ogg_size += os.path.getsize(ogg_path)
+        print(
+            f"{sound}: {os.path.getsize(wav_path)} -> {os.path.getsize(ogg_path)} bytes"
+        )
+
+    print(f"compressed {wav_size} bytes of wav files to {ogg_size} bytes of ogg files")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import gc
+import os
+import sys
+import argparse
+
+# run from the root of the repository
+sys.path.insert(0, os.path.abspath("."))
+
+
+def main() -> int:
+    """count the sprites allocated per second of a game under heavy fire,
+    without pools every sprite taken from a pool would be a new object"""
+    from src.engines import SingleEngine
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--seconds", type=int, default=120)
+    args = parser.parse_args()
+
+    engine = SingleEngine()
+    # the boss shoots bombs from the start, nobody dies
+    engine.player.score = engine.boss_goal
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    dt = 16
+    for frame in range(args.seconds * 1000 // dt):
+        engine.player.life = 3
+        engine.boss.life = 10
+        engine.shoot_laser()
+        engine.update(dt)
+    collections = sum(stats["collections"] for stats in gc.get_stats()) - collections
+
+    print(f"{args.seconds} s of game time, {collections / args.seconds:.1f} gc/s")
+    print(f"  {'sprites':<12}{'without pools':>16}{'with pools':>14}")
+    for sprites, stats in engine.stats().items():
+        created = stats["allocated"] + stats["reused"]
+        print(
+            f"  {sprites:<12}{created / args.seconds:>12.1f} /s"
+            f"{stats['allocated'] / args.seconds:>10.1f} /s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import os
+import sys
+import json
+import pygame
+
+# run from the root of the repository
+IMAGES_DIR = "src/assets/images"
+ATLAS_DIR = "src/assets/atlas"
+ATLAS_WIDTH = 1024
+PADDING = 2
+
+
+def load_images() -> dict:
+    """load every png image of the assets by name"""
+    images = {}
+    for file_name in sorted(os.listdir(IMAGES_DIR)):
+        image_name, extension = os.path.splitext(file_name)
+        if extension == ".png":
+            images[image_name] = pygame.image.load(os.path.join(IMAGES_DIR, file_name))
+    return images
+
+
+def pack(images: dict) -> tuple:
+    """place the images on shelves, the tallest first, return the rects and size"""
+    rects = {}
+    x, y, shelf_height = 0, 0, 0
+    for image_name in sorted(images, key=lambda n: -images[n].get_height()):
+        width, height = images[image_name].get_size()
+        # start a new shelf if the image doesn't fit on this one
+        if x + width > ATLAS_WIDTH:
+            x, y, shelf_height = 0, y + shelf_height + PADDING, 0
+        rects[image_name] = [x, y, width, height]
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+    return rects, (ATLAS_WIDTH, y + shelf_height)
+
+
+def main() -> None:
+    """pack the images in one atlas image with its index"""
+    images = load_images()
+    rects, size = pack(images)
+
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for image_name, rect in rects.items():
+        atlas.blit(images[image_name], rect[:2])
+
+    os.makedirs(ATLAS_DIR, exist_ok=True)
+    pygame.image.save(atlas, os.path.join(ATLAS_DIR, "atlas.png"))
+    # one image per line to keep the index readable
+    with open(os.path.join(ATLAS_DIR, "atlas.json"), "w") as index_file:
+        lines = [f"  {json.dumps(name)}: {rects[name]}" for name in sorted(rects)]
+        index_file.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+    print(f"packed {len(rects)} images in a {size[0]}x{size[1]} atlas")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import struct
+
+# run from the root of the repository
+sys.path.insert(0, os.path.abspath("."))
+
+from src.variables import BUNDLE_PATH, BUNDLE_MAGIC
+
+ASSETS_DIR = "src/assets"
+ATLAS_INDEX = "src/assets/atlas/atlas.json"
+# only needed to build the executable, not by the game
+SKIPPED = {"src/assets/images/icon.ico"}
+
+
+def list_assets() -> list:
+    """return the relative paths of the assets the game reads, the images of
+    the atlas and the wav files replaced by an ogg file are left out"""
+    atlas = set()
+    if os.path.isfile(ATLAS_INDEX):
+        with open(ATLAS_INDEX, "r") as index_file:
+            atlas = set(json.load(index_file))
+
+    paths = []
+    for directory, dir_names, file_names in os.walk(ASSETS_DIR):
+        dir_names.sort()
+        for file_name in sorted(file_names):
+            path = f"{directory}/{file_name}".replace(os.sep, "/")
+            name, extension = os.path.splitext(path)
+            if path == BUNDLE_PATH or path in SKIPPED:
+                continue
+            if path.startswith("src/assets/images/") and extension == ".png":
+                if os.path.basename(name) in atlas:
+                    continue
+            if extension == ".wav" and os.path.isfile(name + ".ogg"):
+                continue
+            paths.append(path)
+    return paths
+
+
+def pack(paths: list) -> bytes:
+    """return the bundle, its index then the files as they are on the disk"""
+    contents = []
+    for path in paths:
+        with open(path, "rb") as asset_file:
+            contents.append(asset_file.read())
+
+    # the offsets depend on the length of the index, which depends on the
+    # offsets, the index is padded with spaces up to where the files start
+    def index(start: int) -> bytes:
+        entries = {}
+        offset = start
+        for path, content in zip(paths, contents):
+            entries[path] = [offset, len(content)]
+            offset += len(content)
+        return json.dumps(entries, separators=(",", ":")).encode()
+
+    header = len(BUNDLE_MAGIC) + 4
+    start = header + len(index(0))
+    # larger offsets only lengthen the index, stop once it fits
+    while header + len(index(start)) > start:
+        start = header + len(index(start))
+    data = index(start)
+    data += b" " * (start - header - len(data))
+    return BUNDLE_MAGIC + struct.pack("<I", len(data)) + data + b"".join(contents)
+
+
+def main() -> None:
+    """pack the assets read by the game in one bundle"""
+    paths = list_assets()
+    bundle = pack(paths)
+    with open(BUNDLE_PATH, "wb") as bundle_file:
+        bundle_file.write(bundle)
+    print(f"packed {len(paths)} assets in {BUNDLE_PATH}, {len(bundle)} bytes")
+
+
+if __name__ == "__main__":
+    sys.exit(main())